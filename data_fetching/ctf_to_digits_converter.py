@@ -22,24 +22,35 @@ python3 ctf_to_digits_convert.py \
     * `o2-ft0-entropy-decoder-workflow`
     * `o2-ft0-digi-writer --output <out>/digits_<run>.root`
 •   Progress is shown with `tqdm`.
-•   A JSON ledger `digits_convert_ledger.json` is written next to `--out-dir`.
+•   An append-only JSON-lines ledger `digits_convert_ledger.jsonl` (one entry
+    per converted CTF) is written into `--out-dir`; a `digits_convert_ledger.json`
+    left by older versions is appended to it once and renamed `*.migrated`.
 
 Prerequisites
 -------------
 * An **O2 runtime environment** (`alienv enter O2/latest`, or a matching CVMFS
   stack) so the three workflows are on $PATH.
 * Python deps: `pip install tqdm psutil humanfriendly` (psutil used for RSS
-  guard similar to the downloader).
+  guard similar to the downloader); `orjson` is used for the ledger if present.
 """
 
 from __future__ import annotations
 
-import argparse, concurrent.futures as cf, json, os, re, subprocess, time, pathlib, psutil
-from typing import List
+import argparse, asyncio, atexit, functools, itertools, os, re, signal, tempfile, time, pathlib, psutil
+from typing import Iterator, List
 from tqdm import tqdm
+
+try:                                 # C-accelerated ledger (de)serialisation
+    import orjson
+    _dumps, _loads = orjson.dumps, orjson.loads
+except ImportError:
+    import json
+    _dumps, _loads = (lambda o: json.dumps(o).encode()), json.loads
 import humanfriendly as hf
 
 RSS_CAP_GB = 40          # pause if converter RAM > 40 GB
+RSS_RESUME_GB = 36       # ... and resume only once it drops below this
+LEDGER_FLUSH_S = 10      # persist buffered ledger entries at least this often
 
 RUN_RE = re.compile(r"run(\d{6,9})")          # extract run from file name
 
@@ -47,40 +58,101 @@ RUN_RE = re.compile(r"run(\d{6,9})")          # extract run from file name
 # helpers
 # ----------------------------------------------------------------------------------
 
-def find_ctf_files(ctf_dir: pathlib.Path) -> List[pathlib.Path]:
-    return sorted(ctf_dir.glob("*.root"))
+@functools.lru_cache(maxsize=None)
+def run_id(name: str) -> str | None:
+    """Run number embedded in a file name (memoised: names are seen repeatedly)."""
+    m = RUN_RE.search(name)
+    return m.group(1) if m else None
+
+
+def find_ctf_files(ctf_dir: pathlib.Path) -> Iterator[os.DirEntry]:
+    """Stream the ROOT files in *ctf_dir* (directory order, nothing listed up front)."""
+    with os.scandir(ctf_dir) as it:
+        for e in it:
+            if e.name.endswith(".root") and e.is_file():
+                yield e
 
 
 def expected_out(ctf: pathlib.Path, out_dir: pathlib.Path) -> pathlib.Path:
-    run_m = RUN_RE.search(ctf.name)
-    run_id = run_m.group(1) if run_m else "unknown"
-    return out_dir / f"digits_{run_id}.root"
+    return out_dir / f"digits_{run_id(ctf.name) or 'unknown'}.root"
 
 
 def already_done(ctf_dir: pathlib.Path, out_dir: pathlib.Path):
-    done_runs = {RUN_RE.search(p.name).group(1)
-                 for p in out_dir.glob("digits_*.root")
-                 if RUN_RE.search(p.name)}
-    for ctf in find_ctf_files(ctf_dir):
-        run_m = RUN_RE.search(ctf.name)
-        if not run_m:
-            continue
-        if run_m.group(1) not in done_runs:
-            yield ctf
-
-
-def run_decoder(ctf: pathlib.Path, out_root: pathlib.Path):
+    """Lazily yield every CTF of the runs that have no digits file yet."""
+    with os.scandir(out_dir) as it:     # closed at once, not whenever it is collected
+        done_runs = {run for e in it
+                     if e.name.startswith("digits_") and e.name.endswith(".root")
+                     and (run := run_id(e.name))}
+    for e in find_ctf_files(ctf_dir):
+        if (run := run_id(e.name)) and run not in done_runs:
+            yield pathlib.Path(e.path)
+
+
+def _tail(fh, n: int = 200) -> str:
+    """Last *n* characters written to the binary file object *fh*."""
+    fh.seek(max(0, fh.tell() - 2 * n))
+    return fh.read().decode(errors="replace")[-n:]
+
+
+def migrate_legacy_ledger(legacy: pathlib.Path, ledger_path: pathlib.Path) -> None:
+    """Append the entries of an old JSON-list ledger to the JSON-lines one, once."""
+    if not legacy.exists():
+        return
+    entries = _loads(legacy.read_bytes() or b"[]")
+    with ledger_path.open("ab") as fh:
+        if fh.tell() and not ledger_path.read_bytes().endswith(b"\n"):
+            fh.write(b"\n")             # don't glue onto a torn last line
+        fh.write(b"".join(_dumps(e) + b"\n" for e in entries))
+    legacy.rename(legacy.with_name(legacy.name + ".migrated"))
+
+
+def _killpg(proc) -> None:
+    """SIGTERM the process group led by *proc* if it is still running."""
+    if proc.returncode is None:
+        try:
+            os.killpg(proc.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+
+async def run_decoder(ctf: pathlib.Path, out_root: pathlib.Path):
     """Call the O2 chain and produce digits_*.root."""
-    cmd = (
-        f"o2-ctf-reader-workflow --ctf-input {ctf} --copy-cmd no-copy --ctf-dict ccdb --onlyDet FT0 --severity=error -b | "
-        f"o2-ft0-digits-writer-workflow --disable-mc -b"
-    )
+    reader = ["o2-ctf-reader-workflow", "--ctf-input", str(ctf), "--copy-cmd", "no-copy",
+              "--ctf-dict", "ccdb", "--onlyDet", "FT0", "--severity=error", "-b"]
+    writer = ["o2-ft0-digits-writer-workflow", "--disable-mc", "-b"]
     t0 = time.time()
-    proc = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-    dt  = time.time() - t0
-    return dict(ctf=str(ctf), out=str(out_root), rc=proc.returncode,
-                seconds=round(dt, 1), stdout=proc.stdout[-200:],
-                stderr=proc.stderr[-200:])
+    # logs go to disk, only their tails are kept -> O(200) bytes per worker
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        # reader | writer wired up here instead of through /bin/sh
+        pipe_r, pipe_w = os.pipe()
+        p1 = p2 = None
+        try:
+            p1 = await asyncio.create_subprocess_exec(
+                *reader, stdout=pipe_w, stderr=err, start_new_session=True)
+            p2 = await asyncio.create_subprocess_exec(
+                *writer, stdin=pipe_r, stdout=out, stderr=err, start_new_session=True)
+        except OSError as e:             # workflow not on $PATH / not executable
+            err.write(f"{e}\n".encode(errors="replace"))
+            # the exit status /bin/sh used to report for the pipeline
+            rc = 127 if isinstance(e, FileNotFoundError) else 126
+            if p1 is not None:           # reader started but has no consumer
+                p1.kill()
+                await p1.wait()
+        finally:
+            os.close(pipe_r)
+            os.close(pipe_w)
+        if p2 is not None:
+            try:
+                rc_writer, rc_reader = await p2.wait(), await p1.wait()
+            except asyncio.CancelledError:   # Ctrl-C: take the pipeline down with us
+                _killpg(p1)
+                _killpg(p2)
+                raise
+            rc = rc_writer or rc_reader
+        dt  = time.time() - t0
+        size = out_root.stat().st_size if out_root.exists() else 0
+        return dict(ctf=str(ctf), out=str(out_root), rc=rc, size=size,
+                    seconds=round(dt, 1), stdout=_tail(out), stderr=_tail(err))
 
 # ----------------------------------------------------------------------------------
 # main
@@ -91,39 +163,113 @@ def main(argv: List[str] | None = None):
     ap.add_argument("--ctf-dir", required=True, type=pathlib.Path)
     ap.add_argument("--out-dir", required=True, type=pathlib.Path)
     ap.add_argument("--workers", type=int, default=os.cpu_count()//2,
-                    help="parallel decoder processes (default: half cores)")
+                    help="parallel decoder pipelines (default: half cores)")
+    ap.add_argument("--ledger-batch", type=int, default=32,
+                    help="buffer this many results before appending to the ledger")
     args = ap.parse_args(argv)
 
     args.out_dir.mkdir(parents=True, exist_ok=True)
-    ledger_path = args.out_dir / "digits_convert_ledger.json"
-    ledger = json.loads(ledger_path.read_text()) if ledger_path.exists() else []
+    ledger_path = args.out_dir / "digits_convert_ledger.jsonl"
+    migrate_legacy_ledger(args.out_dir / "digits_convert_ledger.json", ledger_path)
+    ledger = ([_loads(l) for l in ledger_path.read_bytes().splitlines() if l.strip()]
+              if ledger_path.exists() else [])
 
-    to_do = list(already_done(args.ctf_dir, args.out_dir))
-    if not to_do:
+    # streamed: the first decoder starts while ctf_dir is still being scanned
+    to_do = already_done(args.ctf_dir, args.out_dir)
+    first = next(to_do, None)
+    if first is None:
         print("All CTFs already converted ✨")
         return
+    to_do = itertools.chain([first], to_do)
 
     rss_proc = psutil.Process()
-    bar = tqdm(total=len(to_do), unit="file")
+    rss_gb = 0.0                          # last sample taken by rss_monitor()
+    bar = tqdm(total=None, unit="file")     # total unknown until the scan ends
+    ledger_fh = ledger_path.open("ab")
+    pending: List[dict] = []              # results not yet on disk
+    last_flush = time.time()
 
-    def task(ctf_path: pathlib.Path):
-        """Wrapper that enforces RSS limit."""
-        while rss_proc.memory_info().rss / 1e9 > RSS_CAP_GB:
-            time.sleep(5)
-        out_root = expected_out(ctf_path, args.out_dir)
-        res = run_decoder(ctf_path, out_root)
+    def flush_ledger():
+        """Append all buffered results to the ledger in a single write."""
+        nonlocal last_flush
+        if pending and not ledger_fh.closed:
+            ledger_fh.write(b"".join(_dumps(e) + b"\n" for e in pending))
+            ledger_fh.flush()
+            pending.clear()
+        last_flush = time.time()
+
+    atexit.register(flush_ledger)
+
+    async def rss_monitor(rss_ok: asyncio.Event):
+        """Single sampler for the RSS guard; high/low watermarks avoid flapping."""
+        nonlocal rss_gb
+        while True:
+            rss_gb = rss_proc.memory_info().rss / 1e9
+            if rss_gb > RSS_CAP_GB:
+                rss_ok.clear()
+            elif rss_gb < RSS_RESUME_GB:
+                rss_ok.set()
+            await asyncio.sleep(1)
+
+    def record(res: dict):
         ledger.append(res)
-        ledger_path.write_text(json.dumps(ledger, indent=2))
+        pending.append(res)
+        if (len(pending) >= args.ledger_batch
+                or time.time() - last_flush > LEDGER_FLUSH_S):
+            flush_ledger()
         bar.update()
-        bar.set_postfix(rss=f"{rss_proc.memory_info().rss/1e9:4.1f} GB")
-        return res
+        bar.set_postfix(rss=f"{rss_gb:4.1f} GB")
+
+    async def collect(done: asyncio.Queue):
+        """Book-keep results in completion order, decoupled from the workers."""
+        while True:
+            res = await done.get()
+            try:
+                record(res)
+            except Exception as e:            # disk full / EIO: keep draining, or join() hangs
+                print(f"Ledger write failed, kept in memory for the next flush: {e!r}")
+            finally:
+                done.task_done()
 
-    with cf.ThreadPoolExecutor(max_workers=args.workers) as ex:
-        list(ex.map(task, to_do))
+    async def task(ctf_path: pathlib.Path, rss_ok: asyncio.Event, done: asyncio.Queue):
+        """Wrapper that enforces RSS limit."""
+        await rss_ok.wait()
+        out_root = expected_out(ctf_path, args.out_dir)
+        done.put_nowait(await run_decoder(ctf_path, out_root))
+
+    async def worker(rss_ok: asyncio.Event, done: asyncio.Queue):
+        # all workers pull from the one shared generator -> each CTF runs once
+        for ctf_path in to_do:
+            await task(ctf_path, rss_ok, done)
+
+    async def convert_all():
+        rss_ok, done = asyncio.Event(), asyncio.Queue()
+        rss_ok.set()
+        monitor = asyncio.create_task(rss_monitor(rss_ok))
+        collector = asyncio.create_task(collect(done))
+        try:
+            # one failing worker must not abort the others' conversions
+            results = await asyncio.gather(*(worker(rss_ok, done) for _ in range(args.workers)),
+                                           return_exceptions=True)
+            for res in results:
+                if isinstance(res, Exception):
+                    print(f"Decoder worker stopped: {res!r}")
+            await done.join()
+        finally:
+            monitor.cancel()
+            collector.cancel()
+            while not done.empty():           # interrupted: keep finished results
+                record(done.get_nowait())
+
+    try:
+        asyncio.run(convert_all())
+    finally:                              # also reached on Ctrl-C
+        flush_ledger()
+        ledger_fh.close()
 
     bar.close()
-    total_bytes = sum(pathlib.Path(e['out']).stat().st_size for e in ledger if e.get('rc')==0 and pathlib.Path(e['out']).exists())
-    print(f"\nDone. {len(to_do)} CTFs converted. Output size {hf.format_size(total_bytes)}.")
+    total_bytes = sum(e.get('size', 0) for e in ledger if e.get('rc')==0)
+    print(f"\nDone. {bar.n} CTFs converted. Output size {hf.format_size(total_bytes)}.")
 
 
 if __name__ == "__main__":
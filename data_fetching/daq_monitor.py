@@ -6,19 +6,382 @@ Advanced system monitoring with particle physics flair
 
 import tkinter as tk
 from tkinter import ttk
+from tkinter import font as tkfont
 import psutil
-import threading
 import time
+import asyncio
+import selectors
+from concurrent.futures import ThreadPoolExecutor
 import os
+import sys
+import ctypes
+import ctypes.util
+import platform
 import socket
 import json
+import logging
+import logging.handlers
 import queue
-from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
 import math
 import random
+import itertools
+import heapq
+import zlib
+import numpy as np
+import daq_sdk
+
+try:                                 # Rust encoder/decoder for the jobs store
+    import orjson
+    _loads = orjson.loads
+    def _dumps(obj, indent=False):
+        # numpy columns are written straight from their buffers
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=_json_default, option=option)
+except ImportError:
+    _loads = json.loads
+    def _dumps(obj, indent=False):
+        return json.dumps(obj, indent=2 if indent else None, default=_json_default).encode()
+
+def _history_to_coords(values, width, height, lo, span, out):
+    """Write interleaved x0, y0, x1, y1, ... canvas coordinates into *out*"""
+    n = values.size
+    dx = width / (n - 1)
+    scale = height / span
+    for i in range(n):
+        out[2 * i] = i * dx
+        out[2 * i + 1] = height - (values[i] - lo) * scale
+    return out[:2 * n]
+
+try:                                 # compiled point transform for the graphs
+    from numba import njit
+    history_to_coords = njit(cache=True, fastmath=True)(_history_to_coords)
+except ImportError:
+    _GRAPH_XS = np.arange(4096, dtype=np.float64)  # longer than any history
+    
+    def history_to_coords(values, width, height, lo, span, out):
+        """Write interleaved x0, y0, x1, y1, ... canvas coordinates into *out*"""
+        n = values.size
+        pts = out[:2 * n]
+        ys = pts[1::2]
+        np.multiply(_GRAPH_XS[:n], width / (n - 1), out=pts[0::2])
+        np.subtract(values, lo, out=ys)
+        ys *= -height / span
+        ys += height
+        return pts
+
+class RingF32:
+    """Fixed-size float32 history buffer (no per-sample Python objects)
+
+    Every sample is written twice, at i and i + cap, so the chronological
+    window is always one contiguous slice: view() never copies.
+    """
+    __slots__ = ('buf', 'head', 'full', 'cap', 'version')
+
+    def __init__(self, cap):
+        self.buf = np.empty(2 * cap, dtype=np.float32)
+        self.head = 0
+        self.full = False
+        self.cap = cap
+        self.version = 0  # bumped on every change; lets graphs skip clean redraws
+
+    def push(self, value):
+        self.version += 1
+        self.buf[self.head] = self.buf[self.head + self.cap] = value
+        self.head = (self.head + 1) % self.cap
+        if self.head == 0:
+            self.full = True
+
+    def view(self):
+        """Samples in chronological order"""
+        if self.full:
+            return self.buf[self.head:self.head + self.cap]
+        return self.buf[:self.head]
+
+    def clear(self):
+        self.version += 1
+        self.head = 0
+        self.full = False
+
+    def __len__(self):
+        return self.cap if self.full else self.head
+
+class JobSeries:
+    """Per-job resource snapshots stored column-wise (one numpy array per field)
+
+    Columns grow by doubling up to 2 * cap; once there, the newest cap rows are
+    moved to the front in one copy, so appends stay amortised O(1) and the
+    series keeps exactly the newest cap rows.
+    """
+    __slots__ = ('timestamp', 'cpu', 'memory', 'progress', 'n', 'cap')
+    FIELDS = ('timestamp', 'cpu', 'memory', 'progress')
+
+    def __init__(self, cap, size=64):
+        size = min(size, 2 * cap)
+        self.timestamp = np.empty(size, dtype=np.float64)
+        self.cpu = np.empty(size, dtype=np.float32)
+        self.memory = np.empty(size, dtype=np.float32)
+        self.progress = np.empty(size, dtype=np.float32)
+        self.n = 0
+        self.cap = cap
+
+    def append(self, timestamp, cpu, memory, progress):
+        n = self.n
+        if n == self.timestamp.size:
+            if n >= 2 * self.cap:
+                for name in self.FIELDS:
+                    col = getattr(self, name)
+                    col[:self.cap] = col[n - self.cap:n]
+                n = self.cap
+            else:
+                size = min(2 * n, 2 * self.cap)
+                for name in self.FIELDS:
+                    setattr(self, name, np.resize(getattr(self, name), size))
+        self.timestamp[n] = timestamp
+        self.cpu[n] = cpu
+        self.memory[n] = memory
+        self.progress[n] = progress
+        self.n = n + 1
+
+    def columns(self):
+        """{field: array} of the newest cap rows (views, no copies)"""
+        lo = max(0, self.n - self.cap)
+        return {name: getattr(self, name)[lo:self.n] for name in self.FIELDS}
+
+    @classmethod
+    def from_json(cls, data, cap):
+        """Rebuild from stored columns, or from the older list-of-dicts layout"""
+        series = cls(cap)
+        if isinstance(data, dict):
+            rows = zip(*(data.get(name, ()) for name in cls.FIELDS))
+        else:
+            rows = ((d.get('timestamp', 0.0), d.get('cpu', 0.0), d.get('memory', 0.0),
+                     d.get('progress', 0.0)) for d in data or ())
+        for row in rows:
+            series.append(*row)
+        return series
+
+    def __len__(self):
+        return min(self.n, self.cap)
+
+def _json_default(obj):
+    """Serialise the jobs store's numpy-backed values"""
+    if isinstance(obj, JobSeries):
+        return obj.columns()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"{type(obj).__name__} is not JSON serializable")
+
+@dataclass
+class TickSnapshot:
+    """Fast-cadence readings (CPU, memory, network), sampled once off the Tk thread"""
+    __slots__ = ('t', 'mono', 'cpu_pct', 'mem_pct', 'mem_used', 'mem_avail', 'net')
+    t: float
+    mono: float         # time.monotonic(): rate deltas immune to wall-clock jumps
+    cpu_pct: float
+    mem_pct: float      # flat scalars, not psutil's 11-field svmem tuple
+    mem_used: int
+    mem_avail: int
+    net: tuple
+
+@dataclass
+class SlowSnapshot:
+    """Slow-cadence readings (disk, sensors, load, frequency)"""
+    __slots__ = ('cpu_freq_ghz', 'disk_used', 'disk_total', 'disk_free', 'temp_c', 'load')
+    cpu_freq_ghz: float
+    disk_used: int
+    disk_total: int
+    disk_free: int
+    temp_c: float
+    load: float
+
+class SpscRing:
+    """Single-producer/single-consumer message ring; the GIL orders slot write before index bump"""
+    __slots__ = ('buf', 'head', 'tail', 'mask')
+
+    def __init__(self, cap=1024):
+        cap = 1 << (cap - 1).bit_length()  # power of two -> index with a mask
+        self.buf = [None] * cap
+        self.head = 0  # next slot to read, only advanced by the consumer
+        self.tail = 0  # next slot to write, only advanced by the producer
+        self.mask = cap - 1
+
+    def push(self, item):
+        """Producer side; returns False (item dropped) when the ring is full"""
+        tail = self.tail
+        if tail - self.head > self.mask:
+            return False
+        self.buf[tail & self.mask] = item
+        self.tail = tail + 1
+        return True
+
+    def drain(self):
+        """Consumer side; yield everything published so far"""
+        head, tail = self.head, self.tail
+        while head != tail:
+            idx = head & self.mask
+            item, self.buf[idx] = self.buf[idx], None
+            head += 1
+            self.head = head
+            yield item
+
+# getdents64 is not wrapped by glibc; its number differs per architecture
+SYS_GETDENTS64 = {'x86_64': 217, 'aarch64': 61, 'ppc64le': 202, 's390x': 220}
+
+class ProcCollector:
+    """Per-process CPU usage read from kept-open /proc/<pid>/stat fds"""
+    MAX_OPEN_FDS = 512  # stay well clear of the default 1024 RLIMIT_NOFILE
+    DENTS_BUF = 65536
+
+    def __init__(self):
+        self.linux = sys.platform.startswith('linux') and os.path.isdir('/proc')
+        self._fds = {}    # pid -> fd of /proc/<pid>/stat
+        self._ticks = {}  # pid -> utime + stime at the previous sample
+        self._proc_cache = {}  # pid -> psutil.Process, fallback path only
+        self._tick = 0
+        self._last = time.monotonic()
+        self._hz = os.sysconf('SC_CLK_TCK') if self.linux else 100
+        self._getdents = None
+        nr = SYS_GETDENTS64.get(platform.machine())
+        if self.linux and nr is not None:
+            try:
+                libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+                self._getdents = (libc.syscall, nr)
+                self._dents = ctypes.create_string_buffer(self.DENTS_BUF)
+            except OSError:
+                pass
+
+    def _iter_pids(self):
+        """Yield the integer PIDs in /proc straight from packed linux_dirent64 records"""
+        if self._getdents is None:
+            yield from (int(n) for n in os.listdir(b'/proc') if n.isdigit())
+            return
+        
+        syscall, nr = self._getdents
+        buf = self._dents
+        fd = os.open('/proc', os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            while True:
+                n = syscall(nr, fd, buf, self.DENTS_BUF)
+                if n <= 0:
+                    if n < 0:
+                        raise OSError(ctypes.get_errno(), 'getdents64 on /proc failed')
+                    return
+                view = memoryview(buf)[:n]
+                off = 0
+                while off < n:
+                    # d_ino u64 | d_off s64 | d_reclen u16 | d_type u8 | d_name[]
+                    reclen = int.from_bytes(view[off + 16:off + 18], sys.byteorder)
+                    name = bytes(view[off + 19:off + reclen]).split(b'\0', 1)[0]
+                    if name.isdigit():
+                        yield int(name)
+                    off += reclen
+        finally:
+            os.close(fd)
+
+    def sample(self):
+        """Return ([{'name', 'cpu_percent'}] of processes that used CPU since the last call, process count)"""
+        if not self.linux:
+            return self._sample_psutil()
+        
+        now = time.monotonic()
+        scale = 100.0 / (self._hz * max(now - self._last, 1e-6))
+        self._last = now
+        
+        pids = list(self._iter_pids())
+        # diff against the last walk: exited processes' fds would otherwise leak
+        for pid in self._ticks.keys() - set(pids):
+            self._forget(pid)
+        
+        processes = []
+        for pid in pids:
+            fd = self._fds.get(pid)
+            try:
+                if fd is None:
+                    fd = os.open(f'/proc/{pid}/stat', os.O_RDONLY)
+                raw = os.pread(fd, 1024, 0)
+            except OSError:  # process exited
+                self._forget(pid)
+                continue
+            if pid not in self._fds:
+                if len(self._fds) < self.MAX_OPEN_FDS:
+                    self._fds[pid] = fd
+                else:
+                    os.close(fd)
+            
+            # "pid (comm) state ..." - comm may itself contain spaces/parens
+            try:
+                rpar = raw.rindex(b')')
+                fields = raw[rpar + 2:].split()
+                ticks = int(fields[11]) + int(fields[12])  # utime, stime
+            except (ValueError, IndexError):  # empty / short read of an exiting task
+                self._forget(pid)
+                continue
+            prev = self._ticks.get(pid)
+            self._ticks[pid] = ticks
+            if prev is not None and ticks > prev:
+                name = raw[raw.index(b'(') + 1:rpar].decode(errors='replace')
+                processes.append({'name': name, 'cpu_percent': (ticks - prev) * scale})
+        return processes, len(pids)
+
+    def _proc(self, pid):
+        """Cached psutil.Process: cpu_percent() deltas need the same object every tick"""
+        p = self._proc_cache.get(pid)
+        if p is None or (self._tick % 10 == 0 and not p.is_running()):  # pid reuse
+            p = self._proc_cache[pid] = psutil.Process(pid)
+        return p
+
+    def _sample_psutil(self):
+        self._tick += 1
+        pids = psutil.pids()
+        for pid in self._proc_cache.keys() - set(pids):
+            del self._proc_cache[pid]
+        
+        processes = []
+        for pid in pids:
+            try:
+                proc = self._proc(pid)
+                cpu_percent = proc.cpu_percent(interval=None)
+                if cpu_percent > 0:
+                    processes.append({'pid': pid, 'name': proc.name(), 'cpu_percent': cpu_percent})
+            except:
+                self._proc_cache.pop(pid, None)
+                continue
+        return processes, len(pids)
+
+    def _forget(self, pid):
+        fd = self._fds.pop(pid, None)
+        if fd is not None:
+            os.close(fd)
+        self._ticks.pop(pid, None)
+
+    def close(self):
+        for pid in list(self._fds):
+            self._forget(pid)
 
 class ModernCERNMonitor:
+    PUMP_MS = 20  # how often Tk hands control to the asyncio loop
+    IDLE_PUMP_MS = 100  # ... when Tk also watches the loop's selector (timers only)
+    LOOP_PASSES = 4     # asyncio iterations run per selector wake-up
+    FAST_S, PROCESS_S, SLOW_S = 1, 5, 15  # sampling cadence per metric group
+    JOBS_COMPACT_EVERY = 500  # logged job events before the snapshot is rewritten
+    JOBS_FLUSH_MS = 2000      # buffered job events reach the log at most this often
+    JOB_SERIES_CAP = 1000     # newest updates / resource snapshots kept per job
+    GRAPH_WINDOW_S = 120      # seconds of system history shown per graph
+    MAX_FRAME = 1 << 20       # largest telemetry frame accepted from a client
+    RING_FULL_LOG_S = 10      # at most one "ring full" warning per this many seconds
+    DGRAM_PATH = daq_sdk.DGRAM_PATH   # local clients' AF_UNIX datagram socket
+    JOB_STARTS = ('Starting', 'Initializing')
+    JOB_COLUMNS = (('Job Name', 200), ('Status', 120), ('Progress', 80), ('Events', 80),
+                   ('Errors', 80), ('Duration', 100), ('Start Time', 150))
+    JOB_ROW_H = 30            # px per row of the virtual jobs table
+    JOB_ENDS = ('Completed', 'Completed with Errors', 'Failed')
+    JOB_GRAPH_POINTS = 300    # job updates shown per job graph
+    TAB_SYSTEM, TAB_JOBS = 0, 1  # show_tab indices
+    
     def __init__(self, root):
         self.root = root
         self.root.title("◆ CERN System Monitor ◆")
@@ -27,32 +390,112 @@ class ModernCERNMonitor:
         
         # Data persistence
         self.data_dir = os.path.expanduser("~/.cern_monitor")
-        self.jobs_file = os.path.join(self.data_dir, "lhc_jobs.json")
+        self.jobs_file = os.path.join(self.data_dir, "lhc_jobs.json")      # compacted snapshot
+        self.jobs_log_file = os.path.join(self.data_dir, "lhc_jobs.ndjson")  # events since then
+        self._jobs_log = None
+        self._jobs_log_events = 0
+        self._jobs_pending = []  # encoded log lines not yet written
         self.ensure_data_dir()
         
+        # Jobs-store and listener errors go to a file via a background QueueListener, never
+        # blocking the Tk thread on a slow stdout/stderr
+        self._log = logging.getLogger('cern')
+        self._log.propagate = False
+        self._log.setLevel(logging.INFO)  # listener start-up notice included
+        log_queue = queue.SimpleQueue()
+        self._log.addHandler(logging.handlers.QueueHandler(log_queue))
+        file_handler = logging.FileHandler(os.path.join(self.data_dir, "monitor.log"))
+        file_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+        self._log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+        self._log_listener.start()
+        
         # Monitoring flags
         self.monitoring = True
-        self.current_tab = 0
+        self.current_tab = self.TAB_SYSTEM
+        
+        # asyncio loop sharing the Tk thread, pumped with root.after
+        selector = selectors.DefaultSelector()
+        self._loop = asyncio.SelectorEventLoop(selector)
+        # Tk watches the selector's own epoll/kqueue fd: socket traffic and
+        # executor completions run the loop at once instead of at the next
+        # pump, which then only serves asyncio timers and can tick slowly
+        self._loop_fd = None
+        if hasattr(selector, 'fileno') and hasattr(self.root.tk, 'createfilehandler'):
+            self._loop_fd = selector.fileno()
+            self.root.tk.createfilehandler(self._loop_fd, tk.READABLE, self._on_loop_ready)
+        self._pump_ms = self.PUMP_MS if self._loop_fd is None else self.IDLE_PUMP_MS
+        # one dedicated sampler thread: every psutil / /proc read happens here,
+        # serialised, so the Tk thread never blocks on sensors or disk_usage
+        self._sampler = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sampler")
+        self._loop.set_default_executor(self._sampler)
+        self._tasks = []
+        self._server = None
+        self._dgram = None  # AF_UNIX datagram transport
         
         # Data storage for metrics
-        self.cpu_history = deque(maxlen=120)  # 2 minutes of data
-        self.ram_history = deque(maxlen=120)
-        self.net_history = deque(maxlen=120)
-        self.temp_history = deque(maxlen=120)
+        # fixed-size rings: memory and graph cost stay O(window) however long we run
+        window = self.GRAPH_WINDOW_S // self.FAST_S
+        self.cpu_history = RingF32(window)
+        self.ram_history = RingF32(window)
+        self.net_history = RingF32(window)
         
         # Job-specific resource tracking
-        self.job_cpu_history = deque(maxlen=300)  # 5 minutes for jobs
-        self.job_ram_history = deque(maxlen=300)
-        self.job_net_history = deque(maxlen=300)
-        self.job_progress_history = deque(maxlen=300)
+        self.job_cpu_history = RingF32(self.JOB_GRAPH_POINTS)
+        self.job_ram_history = RingF32(self.JOB_GRAPH_POINTS)
+        self.job_progress_history = RingF32(self.JOB_GRAPH_POINTS)
         
-        # Network counters
-        self.last_net_io = psutil.net_io_counters()
-        self.last_disk_io = psutil.disk_io_counters()
-        self.last_time = time.time()
+        # Network counters (kept-open /proc fd, re-read with pread every tick)
+        try:
+            self._net_fd = os.open('/proc/net/dev', os.O_RDONLY)
+        except OSError:
+            self._net_fd = None  # non-Linux: fall back to psutil
+        self.last_net_io = self._read_net_bytes()
+        self.last_time = time.monotonic()
+        
+        # Top-process sampler for the process card
+        self.proc_collector = ProcCollector()
+        
+        # Most recent per-tick readings (also used for job resource snapshots)
+        self._last_cpu = 0.0
+        self._last_mem = 0.0
+        self._clock_sec = None  # second last formatted into the clock / uptime labels
+        self._clock_str = ""
+        self.cpu_count = psutil.cpu_count()
+        self.boot_time = psutil.boot_time()
+        self.home_dir = os.path.expanduser("~")
+        try:
+            self.hostname = socket.gethostname()
+        except OSError:
+            self.hostname = "unknown"
+        self._probe_sensors()
+        
+        self._redraw_scheduled = False
+        # Canvas -> (fill polygon id, line ids) of each graph
+        self._graph_item_ids = {}
+        # Canvas -> preallocated float64 coordinate buffer
+        self._graph_coords = {}
+        # Canvas -> (history version, width, height) it was last drawn with
+        self._graph_state = {}
+        # Progress bar canvas -> last <Configure> width
+        self._bar_widths = {}
+        
+        # Label text changes queued during a tick, applied in one Tcl call
+        self._pending_text = []
+        self.root.tk.eval('proc ::cern_set_text {args} '
+                          '{foreach {w t} $args {$w configure -text $t}}')
+        # One graph frame in one call. A tag can't batch this: 'coords <tag>'
+        # only moves the first matching item
+        self.root.tk.eval('proc ::cern_graph_coords {c fill lines pts w h} {\n'
+                          '    if {$fill ne ""} {$c coords $fill [concat $pts $w $h 0 $h]}\n'
+                          '    foreach id $lines {$c coords $id $pts}\n'
+                          '    $c itemconfigure graph -state normal\n'
+                          '}')
+        # Repaint every visible row of the virtual jobs table in one call
+        self.root.tk.eval('proc ::cern_canvas_text {c args} '
+                          '{foreach {id t} $args {$c itemconfigure $id -text $t}}')
         
         # Process communication
-        self.process_queue = queue.Queue()
+        self.process_queue = SpscRing()
         self.external_process_data = {
             'name': 'No Active Collision',
             'status': 'Idle',
@@ -63,6 +506,16 @@ class ModernCERNMonitor:
         
         # Jobs database
         self.jobs_history = self.load_jobs_history()
+        # Jobs-tab statistics, kept up to date as jobs change instead of recounted
+        self._jobs_ok = self._jobs_failed = 0
+        for job in self.jobs_history.values():
+            # a handful of distinct statuses: share one string each, so the
+            # status comparisons below mostly end at the identity check
+            if 'status' in job:
+                job['status'] = sys.intern(job['status'])
+            self._count_job(job.get('status', ''), 1)
+        self._recent_ids = heapq.nlargest(5, self.jobs_history, key=self._job_start)
+        self._dirty_jobs = set()  # job ids whose table row needs re-formatting
         self.current_job_id = None
         self.current_job_data = {}
         self.job_start_resources = {}
@@ -76,6 +529,10 @@ class ModernCERNMonitor:
             'mₚ': '938.3 MeV/c²'
         }
         self.lhc_energies = ['13 TeV', '14 TeV', '6.5 TeV/beam']
+        self.beam_particles = ['p', 'Pb', 'p+', 'e⁻']
+        # precomputed rotations: no RNG call per animation frame / label
+        self._particle_iter = itertools.cycle(self.particles)
+        self._constant_iter = itertools.cycle(self.physics_constants.items())
         
         # Modern color scheme with physics flair
         self.colors = {
@@ -97,6 +554,13 @@ class ModernCERNMonitor:
             'particle': '#ff6b35',
             'higgs': '#9b59b6'
         }
+        # plain attributes: no dict lookup + string hash per widget option.
+        # The hex strings themselves stay: Tk_GetColor keeps a per-display cache
+        # keyed by name, so each colour is parsed and allocated only once.
+        for name, value in self.colors.items():
+            setattr(self, 'c_' + name, value)
+        # (family, size, weight) -> named Tk font shared by every widget using it
+        self._fonts = {}
         
         self.setup_modern_styles()
         self.setup_ui()
@@ -112,22 +576,111 @@ class ModernCERNMonitor:
             os.makedirs(self.data_dir)
     
     def load_jobs_history(self):
-        """Load LHC jobs history"""
+        """Load LHC jobs history (snapshot + replayed event log)"""
+        history = {}
         try:
             if os.path.exists(self.jobs_file):
-                with open(self.jobs_file, 'r') as f:
-                    return json.load(f)
-        except Exception as e:
-            print(f"Error loading collision data: {e}")
-        return {}
+                with open(self.jobs_file, 'rb') as f:
+                    history = _loads(f.read())
+            if os.path.exists(self.jobs_log_file):
+                with open(self.jobs_log_file, 'rb') as f:
+                    for line in f:
+                        try:
+                            event = _loads(line)
+                        except ValueError:  # torn last line after a crash
+                            break
+                        self._apply_job_event(history, event)
+                        self._jobs_log_events += 1
+        except (OSError, ValueError) as e:
+            self._log.error("Error loading collision data: %s", e)
+        return history
+    
+    @staticmethod
+    def _apply_job_event(history, event):
+        """Fold one logged job event into the history dict"""
+        if 'new' in event:
+            history[event['id']] = event['new']
+            return
+        job = history.get(event['id'])
+        if job is None:
+            return
+        job.update(event.get('set', {}))
+        if 'snapshot' in event:
+            snap = event['snapshot']
+            ModernCERNMonitor._job_series(job).append(snap['timestamp'], snap['cpu'],
+                                                      snap['memory'], snap['progress'])
+        if 'update' in event:
+            ModernCERNMonitor._append_capped(job.setdefault('updates', []), event['update'])
+    
+    @staticmethod
+    def _job_series(job):
+        """The job's resource snapshots as a JobSeries (converted from JSON on first use)"""
+        series = job.get('resource_snapshots')
+        if not isinstance(series, JobSeries):
+            series = job['resource_snapshots'] = JobSeries.from_json(
+                series, ModernCERNMonitor.JOB_SERIES_CAP)
+        return series
+    
+    @staticmethod
+    def _append_capped(series, item):
+        """Append to a per-job series, keeping only the newest JOB_SERIES_CAP entries"""
+        series.append(item)
+        if len(series) > ModernCERNMonitor.JOB_SERIES_CAP:
+            del series[:-ModernCERNMonitor.JOB_SERIES_CAP]
     
-    def save_jobs_history(self):
-        """Save collision data to storage"""
+    def append_job_event(self, job_id, event):
+        """Queue one job change for the event log: O(1) I/O instead of a full rewrite"""
         try:
-            with open(self.jobs_file, 'w') as f:
-                json.dump(self.jobs_history, f, indent=2)
-        except Exception as e:
-            print(f"Error saving collision data: {e}")
+            if not self._jobs_pending:
+                self.root.after(self.JOBS_FLUSH_MS, self.flush_job_events)
+            self._jobs_pending.append(_dumps({'id': job_id, **event}) + b'\n')
+            self._jobs_log_events += 1
+            if self._jobs_log_events >= self.JOBS_COMPACT_EVERY:
+                self.compact_jobs_history()
+        except TypeError as e:
+            self._log.error("Error saving collision data: %s", e)
+    
+    def flush_job_events(self):
+        """Write the debounced job events to the log in one go"""
+        if not self._jobs_pending:
+            return
+        try:
+            if self._jobs_log is None:
+                self._jobs_log = open(self.jobs_log_file, 'ab')
+            self._jobs_log.write(b''.join(self._jobs_pending))
+            self._jobs_log.flush()
+        except OSError as e:
+            self._log.error("Error saving collision data: %s", e)
+        self._jobs_pending.clear()
+    
+    def compact_jobs_history(self):
+        """Atomically rewrite the snapshot and start an empty event log"""
+        try:
+            tmp = self.jobs_file + '.tmp'
+            with open(tmp, 'wb') as f:
+                f.write(_dumps(self.jobs_history, indent=True))
+            os.replace(tmp, self.jobs_file)
+            self._jobs_pending.clear()  # already part of the snapshot
+            if self._jobs_log is None:
+                self._jobs_log = open(self.jobs_log_file, 'ab')
+            self._jobs_log.truncate(0)
+            self._jobs_log_events = 0
+        except (OSError, TypeError) as e:
+            self._log.error("Error saving collision data: %s", e)
+    
+    def _read_net_bytes(self):
+        """Return (bytes_sent, bytes_recv) summed over all interfaces"""
+        if self._net_fd is None:
+            counters = psutil.net_io_counters()
+            return counters.bytes_sent, counters.bytes_recv
+        
+        sent = recv = 0
+        # Skip the two header lines; rx bytes is field 0, tx bytes field 8
+        for line in os.pread(self._net_fd, 65536, 0).splitlines()[2:]:
+            fields = line.partition(b':')[2].split()
+            recv += int(fields[0])
+            sent += int(fields[8])
+        return sent, recv
     
     def setup_modern_styles(self):
         """Configure ultra-modern theme"""
@@ -136,39 +689,20 @@ class ModernCERNMonitor:
         
         # Configure modern styles with gradients
         style.configure('Modern.TFrame',
-                       background=self.colors['surface'],
+                       background=self.c_surface,
                        borderwidth=0,
                        relief='flat')
         
         style.configure('Glow.TFrame',
-                       background=self.colors['surface'],
+                       background=self.c_surface,
                        borderwidth=1,
                        relief='solid',
-                       bordercolor=self.colors['primary'])
-        
-        # Treeview with modern look
-        style.configure('Modern.Treeview',
-                       background=self.colors['surface'],
-                       foreground=self.colors['text_primary'],
-                       fieldbackground=self.colors['surface'],
-                       borderwidth=0,
-                       rowheight=30)
-        
-        style.configure('Modern.Treeview.Heading',
-                       background=self.colors['surface_light'],
-                       foreground=self.colors['text_primary'],
-                       font=('SF Pro Display', 11, 'bold'),
-                       borderwidth=1,
-                       relief='solid')
-        
-        style.map('Modern.Treeview',
-                 background=[('selected', self.colors['primary'])],
-                 foreground=[('selected', self.colors['bg'])])
+                       bordercolor=self.c_primary)
     
     def setup_ui(self):
         """Setup ultra-modern UI"""
         # Main container
-        main_container = tk.Frame(self.root, bg=self.colors['bg'])
+        main_container = tk.Frame(self.root, bg=self.c_bg)
         main_container.pack(fill=tk.BOTH, expand=True)
         
         # Header with particle effects
@@ -178,100 +712,104 @@ class ModernCERNMonitor:
         self.create_modern_tabs(main_container)
         
         # Tab content areas
-        self.tab_content = tk.Frame(main_container, bg=self.colors['bg'])
+        self.tab_content = tk.Frame(main_container, bg=self.c_bg)
         self.tab_content.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 20))
         
-        # Create tab content
+        # Create tab content (jobs tab is built on first show)
         self.create_system_content()
-        self.create_jobs_content()
+        self._jobs_built = False
+        self._collision_stale = True  # collision card / jobs stats need a repaint
+        self._jobs_stats_stale = True
+        self._jobs_view_stale = True  # jobs tab labels need a repaint
+        self._recent_jobs = []
         
         # Show initial tab
         self.show_tab(0)
     
     def create_modern_header(self, parent):
         """Create modern header with particle effects"""
-        header_frame = tk.Frame(parent, bg=self.colors['bg'], height=80)
+        header_frame = tk.Frame(parent, bg=self.c_bg, height=80)
         header_frame.pack(fill=tk.X, padx=20, pady=20)
         header_frame.pack_propagate(False)
         
         # Left side - Title with physics flair
-        left_frame = tk.Frame(header_frame, bg=self.colors['bg'])
+        left_frame = tk.Frame(header_frame, bg=self.c_bg)
         left_frame.pack(side=tk.LEFT, fill=tk.Y)
         
-        title_frame = tk.Frame(left_frame, bg=self.colors['bg'])
+        title_frame = tk.Frame(left_frame, bg=self.c_bg)
         title_frame.pack(anchor='w')
         
         # Animated particle before title
         self.particle_label = tk.Label(title_frame, 
                                       text=random.choice(self.particles),
-                                      bg=self.colors['bg'], 
-                                      fg=self.colors['particle'],
-                                      font=('SF Pro Display', 20))
+                                      bg=self.c_bg, 
+                                      fg=self.c_particle,
+                                      font=self._font('SF Pro Display', 20))
         self.particle_label.pack(side=tk.LEFT, padx=(0, 10))
         
         title_label = tk.Label(title_frame, 
                               text="CERN Control Center",
-                              bg=self.colors['bg'], 
-                              fg=self.colors['text_primary'],
-                              font=('SF Pro Display', 26, 'bold'))
+                              bg=self.c_bg, 
+                              fg=self.c_text_primary,
+                              font=self._font('SF Pro Display', 26, 'bold'))
         title_label.pack(side=tk.LEFT)
         
         # Subtitle with physics reference
         subtitle_label = tk.Label(left_frame,
                                  text="Data Acquistion Monitoring",
-                                 bg=self.colors['bg'],
-                                 fg=self.colors['text_secondary'],
-                                 font=('SF Pro Display', 11))
+                                 bg=self.c_bg,
+                                 fg=self.c_text_secondary,
+                                 font=self._font('SF Pro Display', 11))
         subtitle_label.pack(anchor='w', pady=(2, 0))
         
         # Right side - Status and time
-        right_frame = tk.Frame(header_frame, bg=self.colors['bg'])
+        right_frame = tk.Frame(header_frame, bg=self.c_bg)
         right_frame.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Time with physics constant easter egg
-        time_frame = tk.Frame(right_frame, bg=self.colors['bg'])
+        time_frame = tk.Frame(right_frame, bg=self.c_bg)
         time_frame.pack(anchor='e')
         
         self.time_label = tk.Label(time_frame,
                                   text="",
-                                  bg=self.colors['bg'],
-                                  fg=self.colors['text_primary'],
-                                  font=('SF Mono', 16, 'bold'))
+                                  bg=self.c_bg,
+                                  fg=self.c_text_primary,
+                                  font=self._font('SF Mono', 16, 'bold'))
         self.time_label.pack(side=tk.LEFT)
         
         # Random physics constant display
         self.physics_label = tk.Label(time_frame,
                                      text="",
-                                     bg=self.colors['bg'],
-                                     fg=self.colors['text_dim'],
-                                     font=('SF Mono', 9))
+                                     bg=self.c_bg,
+                                     fg=self.c_text_dim,
+                                     font=self._font('SF Mono', 9))
         self.physics_label.pack(side=tk.LEFT, padx=(20, 0))
         
         # Status with beam energy
-        status_frame = tk.Frame(right_frame, bg=self.colors['bg'])
+        status_frame = tk.Frame(right_frame, bg=self.c_bg)
         status_frame.pack(anchor='e', pady=(5, 0))
         
         # Beam status dot
         self.beam_dot = tk.Canvas(status_frame, width=12, height=12,
-                                 bg=self.colors['bg'], highlightthickness=0)
+                                 bg=self.c_bg, highlightthickness=0)
         self.beam_dot.pack(side=tk.LEFT, padx=(0, 8))
-        self.beam_dot.create_oval(2, 2, 10, 10, fill=self.colors['success'], outline="")
+        self.beam_dot.create_oval(2, 2, 10, 10, fill=self.c_success, outline="")
         
         self.status_label = tk.Label(status_frame,
                                     text="DAQ Stable • All parameters normal",
-                                    bg=self.colors['bg'],
-                                    fg=self.colors['text_secondary'],
-                                    font=('SF Pro Display', 11))
+                                    bg=self.c_bg,
+                                    fg=self.c_text_secondary,
+                                    font=self._font('SF Pro Display', 11))
         self.status_label.pack(side=tk.LEFT)
     
     def create_modern_tabs(self, parent):
         """Create custom modern tabs"""
-        tabs_container = tk.Frame(parent, bg=self.colors['bg'], height=60)
+        tabs_container = tk.Frame(parent, bg=self.c_bg, height=60)
         tabs_container.pack(fill=tk.X, padx=20, pady=(0, 20))
         tabs_container.pack_propagate(False)
         
         # Tab buttons container
-        tabs_frame = tk.Frame(tabs_container, bg=self.colors['bg'])
+        tabs_frame = tk.Frame(tabs_container, bg=self.c_bg)
         tabs_frame.pack(expand=True)
         
         self.tab_buttons = []
@@ -294,15 +832,15 @@ class ModernCERNMonitor:
     def create_tab_button(self, parent, text, index, tooltip):
         """Create a modern tab button"""
         # Tab container with hover effects
-        tab_container = tk.Frame(parent, bg=self.colors['surface'], relief='flat')
+        tab_container = tk.Frame(parent, bg=self.c_surface, relief='flat')
         
         # Tab button
         tab_button = tk.Button(tab_container,
                               text=text,
                               command=lambda: self.show_tab(index),
-                              bg=self.colors['surface'],
-                              fg=self.colors['text_secondary'],
-                              font=('SF Pro Display', 12, 'bold'),
+                              bg=self.c_surface,
+                              fg=self.c_text_secondary,
+                              font=self._font('SF Pro Display', 12, 'bold'),
                               relief='flat',
                               bd=0,
                               padx=25,
@@ -313,13 +851,13 @@ class ModernCERNMonitor:
         # Hover effects
         def on_enter(e):
             if index != self.current_tab:
-                tab_button.config(bg=self.colors['surface_hover'],
-                                 fg=self.colors['text_primary'])
+                tab_button.config(bg=self.c_surface_hover,
+                                 fg=self.c_text_primary)
         
         def on_leave(e):
             if index != self.current_tab:
-                tab_button.config(bg=self.colors['surface'],
-                                 fg=self.colors['text_secondary'])
+                tab_button.config(bg=self.c_surface,
+                                 fg=self.c_text_secondary)
         
         tab_button.bind("<Enter>", on_enter)
         tab_button.bind("<Leave>", on_leave)
@@ -335,33 +873,44 @@ class ModernCERNMonitor:
         for i, tab_container in enumerate(self.tab_buttons):
             button = tab_container.button
             if i == self.current_tab:
-                button.config(bg=self.colors['primary'],
-                             fg=self.colors['bg'])
+                button.config(bg=self.c_primary,
+                             fg=self.c_bg)
                 # Add glow effect
-                tab_container.config(bg=self.colors['primary'])
+                tab_container.config(bg=self.c_primary)
             else:
-                button.config(bg=self.colors['surface'],
-                             fg=self.colors['text_secondary'])
-                tab_container.config(bg=self.colors['surface'])
+                button.config(bg=self.c_surface,
+                             fg=self.c_text_secondary)
+                tab_container.config(bg=self.c_surface)
     
     def show_tab(self, index):
         """Show specific tab content"""
-        self.current_tab = index
+        previous, self.current_tab = self.current_tab, index
         self.update_tab_buttons()
         
         # Hide all content
         for widget in self.tab_content.winfo_children():
             widget.pack_forget()
         
-        # Show selected content
-        if index == 0:
+        # Show selected content; a hidden tab is not painted, so catch it up here
+        if index == self.TAB_SYSTEM:
             self.system_content.pack(fill=tk.BOTH, expand=True)
-        elif index == 1:
+            if previous != index:
+                self._paint_levels()
+                self._schedule_redraw()
+                self._paint_collision_card()
+        elif index == self.TAB_JOBS:
+            if not self._jobs_built:
+                self.create_jobs_content()
+                self._jobs_built = True
+                self.refresh_jobs_display()
+            if self._jobs_view_stale:
+                self._jobs_view_stale = False
+                self.update_jobs_displays()
             self.jobs_content.pack(fill=tk.BOTH, expand=True)
     
     def create_system_content(self):
         """Create system monitoring content"""
-        self.system_content = tk.Frame(self.tab_content, bg=self.colors['bg'])
+        self.system_content = tk.Frame(self.tab_content, bg=self.c_bg)
         
         # Configure grid
         self.system_content.columnconfigure(0, weight=1)
@@ -385,10 +934,10 @@ class ModernCERNMonitor:
     
     def create_jobs_content(self):
         """Create jobs database content"""
-        self.jobs_content = tk.Frame(self.tab_content, bg=self.colors['bg'])
+        self.jobs_content = tk.Frame(self.tab_content, bg=self.c_bg)
         
         # Top stats row
-        stats_frame = tk.Frame(self.jobs_content, bg=self.colors['bg'])
+        stats_frame = tk.Frame(self.jobs_content, bg=self.c_bg)
         stats_frame.pack(fill=tk.X, pady=(0, 20))
         
         stats_frame.columnconfigure(0, weight=1)
@@ -408,20 +957,20 @@ class ModernCERNMonitor:
         """Create ultra-modern card with glow effects"""
         # Outer glow container
         if glow:
-            glow_container = tk.Frame(parent, bg=self.colors['glow'])
+            glow_container = tk.Frame(parent, bg=self.c_glow)
             glow_container.grid(row=row, column=col, rowspan=rowspan, columnspan=colspan,
                                sticky='nsew', padx=12, pady=12)
             
             # Main card
-            card = tk.Frame(glow_container, bg=self.colors['surface'], relief='flat')
+            card = tk.Frame(glow_container, bg=self.c_surface, relief='flat')
             card.pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
         else:
-            card = tk.Frame(parent, bg=self.colors['surface'], relief='flat')
+            card = tk.Frame(parent, bg=self.c_surface, relief='flat')
             card.grid(row=row, column=col, rowspan=rowspan, columnspan=colspan,
                      sticky='nsew', padx=12, pady=12)
         
         # Top accent line
-        accent_line = tk.Frame(card, bg=self.colors['primary'], height=2)
+        accent_line = tk.Frame(card, bg=self.c_primary, height=2)
         accent_line.pack(fill=tk.X, side=tk.TOP)
         
         return card
@@ -431,46 +980,43 @@ class ModernCERNMonitor:
         card = self.create_modern_card(parent, row, col)
         
         # Header
-        header_frame = tk.Frame(card, bg=self.colors['surface'])
+        header_frame = tk.Frame(card, bg=self.c_surface)
         header_frame.pack(fill=tk.X, padx=20, pady=(15, 10))
         
         tk.Label(header_frame, text="⚡ CPU Usage",
-                bg=self.colors['surface'], fg=self.colors['text_primary'],
-                font=('SF Pro Display', 13, 'bold')).pack(side=tk.LEFT)
+                bg=self.c_surface, fg=self.c_text_primary,
+                font=self._font('SF Pro Display', 13, 'bold')).pack(side=tk.LEFT)
         
         # CPU percentage with large display
         self.cpu_metric = tk.Label(card, text="0%",
-                                  bg=self.colors['surface'], fg=self.colors['primary'],
-                                  font=('SF Mono', 28, 'bold'))
+                                  bg=self.c_surface, fg=self.c_primary,
+                                  font=self._font('SF Mono', 28, 'bold'))
         self.cpu_metric.pack(pady=(0, 10))
         
         # Modern progress bar
-        progress_frame = tk.Frame(card, bg=self.colors['surface'], height=8)
+        progress_frame = tk.Frame(card, bg=self.c_surface, height=8)
         progress_frame.pack(fill=tk.X, padx=20, pady=(0, 15))
         progress_frame.pack_propagate(False)
         
-        self.cpu_bg_bar = tk.Frame(progress_frame, bg=self.colors['bg'], height=8)
+        self.cpu_bg_bar, self.cpu_progress_bar = self.create_progress_bar(progress_frame, self.c_primary)
         self.cpu_bg_bar.pack(fill=tk.X)
         
-        self.cpu_progress_bar = tk.Frame(self.cpu_bg_bar, bg=self.colors['primary'], height=8)
-        self.cpu_progress_bar.place(x=0, y=0, height=8, width=0)
-        
         # Details with physics flair
-        details_frame = tk.Frame(card, bg=self.colors['surface'])
+        details_frame = tk.Frame(card, bg=self.c_surface)
         details_frame.pack(fill=tk.X, padx=20, pady=(0, 15))
         
         self.cpu_cores_label = tk.Label(details_frame, text="",
-                                       bg=self.colors['surface'], fg=self.colors['text_secondary'],
-                                       font=('SF Pro Display', 10))
+                                       bg=self.c_surface, fg=self.c_text_secondary,
+                                       font=self._font('SF Pro Display', 10))
         self.cpu_cores_label.pack(anchor=tk.W)
         
         self.cpu_freq_label = tk.Label(details_frame, text="",
-                                      bg=self.colors['surface'], fg=self.colors['text_secondary'],
-                                      font=('SF Pro Display', 10))
+                                      bg=self.c_surface, fg=self.c_text_secondary,
+                                      font=self._font('SF Pro Display', 10))
         self.cpu_freq_label.pack(anchor=tk.W)
         
         # Enhanced graph
-        self.cpu_graph = tk.Canvas(card, height=50, bg=self.colors['surface'],
+        self.cpu_graph = tk.Canvas(card, height=50, bg=self.c_surface,
                                   highlightthickness=0)
         self.cpu_graph.pack(fill=tk.X, padx=20, pady=(0, 15))
     
@@ -478,45 +1024,42 @@ class ModernCERNMonitor:
         """Enhanced memory card"""
         card = self.create_modern_card(parent, row, col)
         
-        header_frame = tk.Frame(card, bg=self.colors['surface'])
+        header_frame = tk.Frame(card, bg=self.c_surface)
         header_frame.pack(fill=tk.X, padx=20, pady=(15, 10))
         
         tk.Label(header_frame, text="🧠 RAM Usage",
-                bg=self.colors['surface'], fg=self.colors['text_primary'],
-                font=('SF Pro Display', 13, 'bold')).pack(side=tk.LEFT)
+                bg=self.c_surface, fg=self.c_text_primary,
+                font=self._font('SF Pro Display', 13, 'bold')).pack(side=tk.LEFT)
         
         self.memory_metric = tk.Label(card, text="0%",
-                                     bg=self.colors['surface'], fg=self.colors['accent'],
-                                     font=('SF Mono', 28, 'bold'))
+                                     bg=self.c_surface, fg=self.c_accent,
+                                     font=self._font('SF Mono', 28, 'bold'))
         self.memory_metric.pack(pady=(0, 10))
         
         # Progress bar
-        progress_frame = tk.Frame(card, bg=self.colors['surface'], height=8)
+        progress_frame = tk.Frame(card, bg=self.c_surface, height=8)
         progress_frame.pack(fill=tk.X, padx=20, pady=(0, 15))
         progress_frame.pack_propagate(False)
         
-        self.memory_bg_bar = tk.Frame(progress_frame, bg=self.colors['bg'], height=8)
+        self.memory_bg_bar, self.memory_progress_bar = self.create_progress_bar(progress_frame, self.c_accent)
         self.memory_bg_bar.pack(fill=tk.X)
         
-        self.memory_progress_bar = tk.Frame(self.memory_bg_bar, bg=self.colors['accent'], height=8)
-        self.memory_progress_bar.place(x=0, y=0, height=8, width=0)
-        
         # Details
-        details_frame = tk.Frame(card, bg=self.colors['surface'])
+        details_frame = tk.Frame(card, bg=self.c_surface)
         details_frame.pack(fill=tk.X, padx=20, pady=(0, 15))
         
         self.memory_used_label = tk.Label(details_frame, text="",
-                                         bg=self.colors['surface'], fg=self.colors['text_secondary'],
-                                         font=('SF Pro Display', 10))
+                                         bg=self.c_surface, fg=self.c_text_secondary,
+                                         font=self._font('SF Pro Display', 10))
         self.memory_used_label.pack(anchor=tk.W)
         
         self.memory_available_label = tk.Label(details_frame, text="",
-                                              bg=self.colors['surface'], fg=self.colors['text_secondary'],
-                                              font=('SF Pro Display', 10))
+                                              bg=self.c_surface, fg=self.c_text_secondary,
+                                              font=self._font('SF Pro Display', 10))
         self.memory_available_label.pack(anchor=tk.W)
         
         # Graph
-        self.memory_graph = tk.Canvas(card, height=50, bg=self.colors['surface'],
+        self.memory_graph = tk.Canvas(card, height=50, bg=self.c_surface,
                                      highlightthickness=0)
         self.memory_graph.pack(fill=tk.X, padx=20, pady=(0, 15))
     
@@ -524,34 +1067,34 @@ class ModernCERNMonitor:
         """Enhanced network card"""
         card = self.create_modern_card(parent, row, col)
         
-        header_frame = tk.Frame(card, bg=self.colors['surface'])
+        header_frame = tk.Frame(card, bg=self.c_surface)
         header_frame.pack(fill=tk.X, padx=20, pady=(15, 10))
         
         tk.Label(header_frame, text="🌐 Network Usage",
-                bg=self.colors['surface'], fg=self.colors['text_primary'],
-                font=('SF Pro Display', 13, 'bold')).pack(side=tk.LEFT)
+                bg=self.c_surface, fg=self.c_text_primary,
+                font=self._font('SF Pro Display', 13, 'bold')).pack(side=tk.LEFT)
         
         self.network_metric = tk.Label(card, text="0 KB/s",
-                                      bg=self.colors['surface'], fg=self.colors['secondary'],
-                                      font=('SF Mono', 20, 'bold'))
+                                      bg=self.c_surface, fg=self.c_secondary,
+                                      font=self._font('SF Mono', 20, 'bold'))
         self.network_metric.pack(pady=(0, 10))
         
         # Upload/Download with physics units
-        speeds_frame = tk.Frame(card, bg=self.colors['surface'])
+        speeds_frame = tk.Frame(card, bg=self.c_surface)
         speeds_frame.pack(pady=(0, 15))
         
         self.upload_label = tk.Label(speeds_frame, text="↑ 0 KB/s",
-                                    bg=self.colors['surface'], fg=self.colors['text_secondary'],
-                                    font=('SF Pro Display', 10))
+                                    bg=self.c_surface, fg=self.c_text_secondary,
+                                    font=self._font('SF Pro Display', 10))
         self.upload_label.pack()
         
         self.download_label = tk.Label(speeds_frame, text="↓ 0 KB/s",
-                                      bg=self.colors['surface'], fg=self.colors['text_secondary'],
-                                      font=('SF Pro Display', 10))
+                                      bg=self.c_surface, fg=self.c_text_secondary,
+                                      font=self._font('SF Pro Display', 10))
         self.download_label.pack()
         
         # Graph
-        self.network_graph = tk.Canvas(card, height=50, bg=self.colors['surface'],
+        self.network_graph = tk.Canvas(card, height=50, bg=self.c_surface,
                                       highlightthickness=0)
         self.network_graph.pack(fill=tk.X, padx=20, pady=(0, 15))
     
@@ -559,72 +1102,69 @@ class ModernCERNMonitor:
         """Enhanced storage card"""
         card = self.create_modern_card(parent, row, col)
         
-        header_frame = tk.Frame(card, bg=self.colors['surface'])
+        header_frame = tk.Frame(card, bg=self.c_surface)
         header_frame.pack(fill=tk.X, padx=20, pady=(15, 10))
         
         tk.Label(header_frame, text="💾 Storage",
-                bg=self.colors['surface'], fg=self.colors['text_primary'],
-                font=('SF Pro Display', 13, 'bold')).pack(side=tk.LEFT)
+                bg=self.c_surface, fg=self.c_text_primary,
+                font=self._font('SF Pro Display', 13, 'bold')).pack(side=tk.LEFT)
         
         self.storage_metric = tk.Label(card, text="0%",
-                                      bg=self.colors['surface'], fg=self.colors['warning'],
-                                      font=('SF Mono', 28, 'bold'))
+                                      bg=self.c_surface, fg=self.c_warning,
+                                      font=self._font('SF Mono', 28, 'bold'))
         self.storage_metric.pack(pady=(0, 10))
         
         # Progress bar
-        progress_frame = tk.Frame(card, bg=self.colors['surface'], height=8)
+        progress_frame = tk.Frame(card, bg=self.c_surface, height=8)
         progress_frame.pack(fill=tk.X, padx=20, pady=(0, 15))
         progress_frame.pack_propagate(False)
         
-        self.storage_bg_bar = tk.Frame(progress_frame, bg=self.colors['bg'], height=8)
+        self.storage_bg_bar, self.storage_progress_bar = self.create_progress_bar(progress_frame, self.c_warning)
         self.storage_bg_bar.pack(fill=tk.X)
         
-        self.storage_progress_bar = tk.Frame(self.storage_bg_bar, bg=self.colors['warning'], height=8)
-        self.storage_progress_bar.place(x=0, y=0, height=8, width=0)
-        
         # Details
-        details_frame = tk.Frame(card, bg=self.colors['surface'])
+        details_frame = tk.Frame(card, bg=self.c_surface)
         details_frame.pack(fill=tk.X, padx=20, pady=(0, 15))
         
         self.storage_used_label = tk.Label(details_frame, text="",
-                                          bg=self.colors['surface'], fg=self.colors['text_secondary'],
-                                          font=('SF Pro Display', 10))
+                                          bg=self.c_surface, fg=self.c_text_secondary,
+                                          font=self._font('SF Pro Display', 10))
         self.storage_used_label.pack(anchor=tk.W)
         
         self.storage_free_label = tk.Label(details_frame, text="",
-                                          bg=self.colors['surface'], fg=self.colors['text_secondary'],
-                                          font=('SF Pro Display', 10))
+                                          bg=self.c_surface, fg=self.c_text_secondary,
+                                          font=self._font('SF Pro Display', 10))
         self.storage_free_label.pack(anchor=tk.W)
     
     def create_process_card(self, parent, row, col):
         """Enhanced process card"""
         card = self.create_modern_card(parent, row, col)
         
-        header_frame = tk.Frame(card, bg=self.colors['surface'])
+        header_frame = tk.Frame(card, bg=self.c_surface)
         header_frame.pack(fill=tk.X, padx=20, pady=(15, 10))
         
         tk.Label(header_frame, text="⚙️ Active Processes",
-                bg=self.colors['surface'], fg=self.colors['text_primary'],
-                font=('SF Pro Display', 13, 'bold')).pack(side=tk.LEFT)
+                bg=self.c_surface, fg=self.c_text_primary,
+                font=self._font('SF Pro Display', 13, 'bold')).pack(side=tk.LEFT)
         
         self.process_count_metric = tk.Label(card, text="0",
-                                            bg=self.colors['surface'], fg=self.colors['success'],
-                                            font=('SF Mono', 28, 'bold'))
+                                            bg=self.c_surface, fg=self.c_success,
+                                            font=self._font('SF Mono', 28, 'bold'))
         self.process_count_metric.pack(pady=(0, 5))
         
         tk.Label(card, text="Running Processes",
-                bg=self.colors['surface'], fg=self.colors['text_secondary'],
-                font=('SF Pro Display', 10)).pack(pady=(0, 15))
+                bg=self.c_surface, fg=self.c_text_secondary,
+                font=self._font('SF Pro Display', 10)).pack(pady=(0, 15))
         
         # Top processes
-        processes_frame = tk.Frame(card, bg=self.colors['surface'])
+        processes_frame = tk.Frame(card, bg=self.c_surface)
         processes_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 15))
         
         self.process_labels = []
         for i in range(6):
             label = tk.Label(processes_frame, text="",
-                           bg=self.colors['surface'], fg=self.colors['text_secondary'],
-                           font=('SF Mono', 8))
+                           bg=self.c_surface, fg=self.c_text_secondary,
+                           font=self._font('SF Mono', 8))
             label.pack(anchor=tk.W, pady=1)
             self.process_labels.append(label)
     
@@ -632,40 +1172,40 @@ class ModernCERNMonitor:
         """Enhanced system info card"""
         card = self.create_modern_card(parent, row, col)
         
-        header_frame = tk.Frame(card, bg=self.colors['surface'])
+        header_frame = tk.Frame(card, bg=self.c_surface)
         header_frame.pack(fill=tk.X, padx=20, pady=(15, 10))
         
         tk.Label(header_frame, text="🔬 System Core",
-                bg=self.colors['surface'], fg=self.colors['text_primary'],
-                font=('SF Pro Display', 13, 'bold')).pack(side=tk.LEFT)
+                bg=self.c_surface, fg=self.c_text_primary,
+                font=self._font('SF Pro Display', 13, 'bold')).pack(side=tk.LEFT)
         
         # Uptime with scientific format
         self.uptime_label = tk.Label(card, text="",
-                                    bg=self.colors['surface'], fg=self.colors['primary'],
-                                    font=('SF Mono', 18, 'bold'))
+                                    bg=self.c_surface, fg=self.c_primary,
+                                    font=self._font('SF Mono', 18, 'bold'))
         self.uptime_label.pack(pady=(0, 5))
         
         tk.Label(card, text="System Uptime",
-                bg=self.colors['surface'], fg=self.colors['text_secondary'],
-                font=('SF Pro Display', 10)).pack(pady=(0, 15))
+                bg=self.c_surface, fg=self.c_text_secondary,
+                font=self._font('SF Pro Display', 10)).pack(pady=(0, 15))
         
         # System details
-        details_frame = tk.Frame(card, bg=self.colors['surface'])
+        details_frame = tk.Frame(card, bg=self.c_surface)
         details_frame.pack(fill=tk.X, padx=20, pady=(0, 15))
         
         self.hostname_label = tk.Label(details_frame, text="",
-                                      bg=self.colors['surface'], fg=self.colors['text_secondary'],
-                                      font=('SF Pro Display', 9))
+                                      bg=self.c_surface, fg=self.c_text_secondary,
+                                      font=self._font('SF Pro Display', 9))
         self.hostname_label.pack(anchor=tk.W, pady=1)
         
         self.temperature_label = tk.Label(details_frame, text="",
-                                         bg=self.colors['surface'], fg=self.colors['text_secondary'],
-                                         font=('SF Pro Display', 9))
+                                         bg=self.c_surface, fg=self.c_text_secondary,
+                                         font=self._font('SF Pro Display', 9))
         self.temperature_label.pack(anchor=tk.W, pady=1)
         
         self.load_label = tk.Label(details_frame, text="",
-                                  bg=self.colors['surface'], fg=self.colors['text_secondary'],
-                                  font=('SF Pro Display', 9))
+                                  bg=self.c_surface, fg=self.c_text_secondary,
+                                  font=self._font('SF Pro Display', 9))
         self.load_label.pack(anchor=tk.W, pady=1)
     
     def create_enhanced_job_card(self, parent, row, col, colspan=1):
@@ -673,116 +1213,115 @@ class ModernCERNMonitor:
         card = self.create_modern_card(parent, row, col, colspan=colspan, glow=True)
         
         # Header with status
-        header_frame = tk.Frame(card, bg=self.colors['surface'])
+        header_frame = tk.Frame(card, bg=self.c_surface)
         header_frame.pack(fill=tk.X, padx=20, pady=(15, 10))
         
         tk.Label(header_frame, text="⚛️ DAQ Jobs Monitor",
-                bg=self.colors['surface'], fg=self.colors['text_primary'],
-                font=('SF Pro Display', 14, 'bold')).pack(side=tk.LEFT)
+                bg=self.c_surface, fg=self.c_text_primary,
+                font=self._font('SF Pro Display', 14, 'bold')).pack(side=tk.LEFT)
         
         # Beam status indicator
         self.collision_dot = tk.Canvas(header_frame, width=12, height=12,
-                                      bg=self.colors['surface'], highlightthickness=0)
+                                      bg=self.c_surface, highlightthickness=0)
         self.collision_dot.pack(side=tk.RIGHT)
-        self.collision_dot.create_oval(1, 1, 11, 11, fill=self.colors['border'], outline="")
+        self._dot_color = self.c_border
+        self.collision_dot_item = self.collision_dot.create_oval(1, 1, 11, 11, fill=self._dot_color,
+                                                                 outline="")
         
         # Main content area
-        content_area = tk.Frame(card, bg=self.colors['surface'])
+        content_area = tk.Frame(card, bg=self.c_surface)
         content_area.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 15))
         
         # Left side - job info
-        left_frame = tk.Frame(content_area, bg=self.colors['surface'])
+        left_frame = tk.Frame(content_area, bg=self.c_surface)
         left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
         self.job_name_label = tk.Label(left_frame, text="No Active Job",
-                                      bg=self.colors['surface'], fg=self.colors['text_primary'],
-                                      font=('SF Pro Display', 16, 'bold'))
+                                      bg=self.c_surface, fg=self.c_text_primary,
+                                      font=self._font('SF Pro Display', 16, 'bold'))
         self.job_name_label.pack(anchor=tk.W)
         
         self.job_status_label = tk.Label(left_frame, text="Standby Mode",
-                                        bg=self.colors['surface'], fg=self.colors['text_secondary'],
-                                        font=('SF Pro Display', 12))
+                                        bg=self.c_surface, fg=self.c_text_secondary,
+                                        font=self._font('SF Pro Display', 12))
         self.job_status_label.pack(anchor=tk.W, pady=(2, 15))
         
         # Enhanced progress with particle animation
-        progress_container = tk.Frame(left_frame, bg=self.colors['surface'])
+        progress_container = tk.Frame(left_frame, bg=self.c_surface)
         progress_container.pack(fill=tk.X, pady=(0, 10))
         
-        self.job_progress_bg = tk.Frame(progress_container, bg=self.colors['bg'], height=8)
+        self.job_progress_bg, self.job_progress_bar = self.create_progress_bar(progress_container, self.c_primary)
         self.job_progress_bg.pack(fill=tk.X)
         
-        self.job_progress_bar = tk.Frame(self.job_progress_bg, bg=self.colors['primary'], height=8)
-        self.job_progress_bar.place(x=0, y=0, height=8, width=0)
-        
         self.job_progress_label = tk.Label(left_frame, text="0.0%",
-                                          bg=self.colors['surface'], fg=self.colors['text_secondary'],
-                                          font=('SF Pro Display', 10))
+                                          bg=self.c_surface, fg=self.c_text_secondary,
+                                          font=self._font('SF Pro Display', 10))
         self.job_progress_label.pack(anchor=tk.W)
         
         # Job metrics
-        metrics_frame = tk.Frame(left_frame, bg=self.colors['surface'])
+        metrics_frame = tk.Frame(left_frame, bg=self.c_surface)
         metrics_frame.pack(fill=tk.X, pady=(15, 0))
         
         self.job_completed_label = tk.Label(metrics_frame, text="Events: 0",
-                                           bg=self.colors['surface'], fg=self.colors['success'],
-                                           font=('SF Pro Display', 10))
+                                           bg=self.c_surface, fg=self.c_success,
+                                           font=self._font('SF Pro Display', 10))
         self.job_completed_label.pack(anchor=tk.W, pady=1)
         
         self.job_failed_label = tk.Label(metrics_frame, text="Errors: 0",
-                                        bg=self.colors['surface'], fg=self.colors['error'],
-                                        font=('SF Pro Display', 10))
+                                        bg=self.c_surface, fg=self.c_error,
+                                        font=self._font('SF Pro Display', 10))
         self.job_failed_label.pack(anchor=tk.W, pady=1)
         
         self.job_eta_label = tk.Label(metrics_frame, text="ETA: ∞",
-                                     bg=self.colors['surface'], fg=self.colors['accent'],
-                                     font=('SF Pro Display', 10))
+                                     bg=self.c_surface, fg=self.c_accent,
+                                     font=self._font('SF Pro Display', 10))
         self.job_eta_label.pack(anchor=tk.W, pady=1)
         
         # Right side - real-time resource graphs
-        right_frame = tk.Frame(content_area, bg=self.colors['surface'])
+        right_frame = tk.Frame(content_area, bg=self.c_surface)
         right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(20, 0))
         
         tk.Label(right_frame, text="Resource Usage During Collision",
-                bg=self.colors['surface'], fg=self.colors['text_primary'],
-                font=('SF Pro Display', 12, 'bold')).pack(anchor=tk.W)
+                bg=self.c_surface, fg=self.c_text_primary,
+                font=self._font('SF Pro Display', 12, 'bold')).pack(anchor=tk.W)
         
         # Resource graphs container
-        graphs_container = tk.Frame(right_frame, bg=self.colors['surface'])
+        graphs_container = tk.Frame(right_frame, bg=self.c_surface)
         graphs_container.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
         
         # CPU graph for job
-        cpu_graph_frame = tk.Frame(graphs_container, bg=self.colors['surface'])
+        cpu_graph_frame = tk.Frame(graphs_container, bg=self.c_surface)
         cpu_graph_frame.pack(fill=tk.X, pady=(0, 8))
         
         tk.Label(cpu_graph_frame, text="CPU %",
-                bg=self.colors['surface'], fg=self.colors['primary'],
-                font=('SF Pro Display', 9, 'bold')).pack(anchor=tk.W)
+                bg=self.c_surface, fg=self.c_primary,
+                font=self._font('SF Pro Display', 9, 'bold')).pack(anchor=tk.W)
         
-        self.job_cpu_graph = tk.Canvas(cpu_graph_frame, height=40, bg=self.colors['surface'],
+        self.job_cpu_graph = tk.Canvas(cpu_graph_frame, height=40, bg=self.c_surface,
                                       highlightthickness=0)
         self.job_cpu_graph.pack(fill=tk.X, pady=(2, 0))
         
         # Memory graph for job
-        mem_graph_frame = tk.Frame(graphs_container, bg=self.colors['surface'])
+        mem_graph_frame = tk.Frame(graphs_container, bg=self.c_surface)
         mem_graph_frame.pack(fill=tk.X, pady=(0, 8))
         
         tk.Label(mem_graph_frame, text="Memory %",
-                bg=self.colors['surface'], fg=self.colors['accent'],
-                font=('SF Pro Display', 9, 'bold')).pack(anchor=tk.W)
+                bg=self.c_surface, fg=self.c_accent,
+                font=self._font('SF Pro Display', 9, 'bold')).pack(anchor=tk.W)
         
-        self.job_mem_graph = tk.Canvas(mem_graph_frame, height=40, bg=self.colors['surface'],
+        self.job_mem_graph = tk.Canvas(mem_graph_frame, height=40, bg=self.c_surface,
                                       highlightthickness=0)
         self.job_mem_graph.pack(fill=tk.X, pady=(2, 0))
         
         # Progress timeline
-        progress_graph_frame = tk.Frame(graphs_container, bg=self.colors['surface'])
+        progress_graph_frame = tk.Frame(graphs_container, bg=self.c_surface)
         progress_graph_frame.pack(fill=tk.X)
         
         tk.Label(progress_graph_frame, text="Progress Timeline",
-                bg=self.colors['surface'], fg=self.colors['secondary'],
-                font=('SF Pro Display', 9, 'bold')).pack(anchor=tk.W)
+                bg=self.c_surface, fg=self.c_secondary,
+                font=self._font('SF Pro Display', 9, 'bold')).pack(anchor=tk.W)
         
-        self.job_progress_graph = tk.Canvas(progress_graph_frame, height=40, bg=self.colors['surface'],
+        self.job_progress_graph = tk.Canvas(progress_graph_frame, height=40, bg=self.c_surface,
                                            highlightthickness=0)
         self.job_progress_graph.pack(fill=tk.X, pady=(2, 0))
     
@@ -791,30 +1330,30 @@ class ModernCERNMonitor:
         card = self.create_modern_card(parent, row, col)
         
         tk.Label(card, text="⚛️ DAQ Jobs Statistics",
-                bg=self.colors['surface'], fg=self.colors['text_primary'],
-                font=('SF Pro Display', 12, 'bold')).pack(pady=(15, 10))
+                bg=self.c_surface, fg=self.c_text_primary,
+                font=self._font('SF Pro Display', 12, 'bold')).pack(pady=(15, 10))
         
-        stats_frame = tk.Frame(card, bg=self.colors['surface'])
+        stats_frame = tk.Frame(card, bg=self.c_surface)
         stats_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=(0, 15))
         
         self.total_collisions_label = tk.Label(stats_frame, text="Total Runs: 0",
-                                              bg=self.colors['surface'], fg=self.colors['text_secondary'],
-                                              font=('SF Pro Display', 10))
+                                              bg=self.c_surface, fg=self.c_text_secondary,
+                                              font=self._font('SF Pro Display', 10))
         self.total_collisions_label.pack(anchor=tk.W, pady=2)
         
         self.successful_collisions_label = tk.Label(stats_frame, text="Successful: 0",
-                                                   bg=self.colors['surface'], fg=self.colors['success'],
-                                                   font=('SF Pro Display', 10))
+                                                   bg=self.c_surface, fg=self.c_success,
+                                                   font=self._font('SF Pro Display', 10))
         self.successful_collisions_label.pack(anchor=tk.W, pady=2)
         
         self.failed_collisions_label = tk.Label(stats_frame, text="Failed: 0",
-                                               bg=self.colors['surface'], fg=self.colors['error'],
-                                               font=('SF Pro Display', 10))
+                                               bg=self.c_surface, fg=self.c_error,
+                                               font=self._font('SF Pro Display', 10))
         self.failed_collisions_label.pack(anchor=tk.W, pady=2)
         
         self.efficiency_label = tk.Label(stats_frame, text="Efficiency: 0%",
-                                        bg=self.colors['surface'], fg=self.colors['primary'],
-                                        font=('SF Pro Display', 10, 'bold'))
+                                        bg=self.c_surface, fg=self.c_primary,
+                                        font=self._font('SF Pro Display', 10, 'bold'))
         self.efficiency_label.pack(anchor=tk.W, pady=2)
     
     def create_active_collision_card(self, parent, row, col):
@@ -822,30 +1361,30 @@ class ModernCERNMonitor:
         card = self.create_modern_card(parent, row, col)
         
         tk.Label(card, text="🔄 Active Job",
-                bg=self.colors['surface'], fg=self.colors['text_primary'],
-                font=('SF Pro Display', 12, 'bold')).pack(pady=(15, 10))
+                bg=self.c_surface, fg=self.c_text_primary,
+                font=self._font('SF Pro Display', 12, 'bold')).pack(pady=(15, 10))
         
-        info_frame = tk.Frame(card, bg=self.colors['surface'])
+        info_frame = tk.Frame(card, bg=self.c_surface)
         info_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=(0, 15))
         
         self.active_collision_name = tk.Label(info_frame, text="No active collision",
-                                             bg=self.colors['surface'], fg=self.colors['text_secondary'],
-                                             font=('SF Pro Display', 10))
+                                             bg=self.c_surface, fg=self.c_text_secondary,
+                                             font=self._font('SF Pro Display', 10))
         self.active_collision_name.pack(anchor=tk.W, pady=2)
         
         self.collision_progress_label = tk.Label(info_frame, text="Progress: 0%",
-                                                bg=self.colors['surface'], fg=self.colors['primary'],
-                                                font=('SF Pro Display', 10))
+                                                bg=self.c_surface, fg=self.c_primary,
+                                                font=self._font('SF Pro Display', 10))
         self.collision_progress_label.pack(anchor=tk.W, pady=2)
         
         self.collision_eta_label = tk.Label(info_frame, text="ETA: ∞",
-                                           bg=self.colors['surface'], fg=self.colors['accent'],
-                                           font=('SF Pro Display', 10))
+                                           bg=self.c_surface, fg=self.c_accent,
+                                           font=self._font('SF Pro Display', 10))
         self.collision_eta_label.pack(anchor=tk.W, pady=2)
         
         self.beam_energy_label = tk.Label(info_frame, text="Energy: 13 TeV",
-                                         bg=self.colors['surface'], fg=self.colors['secondary'],
-                                         font=('SF Pro Display', 10))
+                                         bg=self.c_surface, fg=self.c_secondary,
+                                         font=self._font('SF Pro Display', 10))
         self.beam_energy_label.pack(anchor=tk.W, pady=2)
     
     def create_beam_stats_card(self, parent, row, col):
@@ -853,29 +1392,29 @@ class ModernCERNMonitor:
         card = self.create_modern_card(parent, row, col)
         
         tk.Label(card, text="⚡ DAQ Jobs Status",
-                bg=self.colors['surface'], fg=self.colors['text_primary'],
-                font=('SF Pro Display', 12, 'bold')).pack(pady=(15, 10))
+                bg=self.c_surface, fg=self.c_text_primary,
+                font=self._font('SF Pro Display', 12, 'bold')).pack(pady=(15, 10))
         
-        beam_frame = tk.Frame(card, bg=self.colors['surface'])
+        beam_frame = tk.Frame(card, bg=self.c_surface)
         beam_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=(0, 15))
         
         self.beam_energy_display = tk.Label(beam_frame, text="13 TeV",
-                                           bg=self.colors['surface'], fg=self.colors['secondary'],
-                                           font=('SF Mono', 16, 'bold'))
+                                           bg=self.c_surface, fg=self.c_secondary,
+                                           font=self._font('SF Mono', 16, 'bold'))
         self.beam_energy_display.pack(pady=(0, 5))
         
         tk.Label(beam_frame, text="System Uptime",
-                bg=self.colors['surface'], fg=self.colors['text_secondary'],
-                font=('SF Pro Display', 9)).pack(pady=(0, 5))
+                bg=self.c_surface, fg=self.c_text_secondary,
+                font=self._font('SF Pro Display', 9)).pack(pady=(0, 5))
         
         self.luminosity_label = tk.Label(beam_frame, text="Uptime: 00:00:00",
-                                        bg=self.colors['surface'], fg=self.colors['text_secondary'],
-                                        font=('SF Pro Display', 9))
+                                        bg=self.c_surface, fg=self.c_text_secondary,
+                                        font=self._font('SF Pro Display', 9))
         self.luminosity_label.pack(anchor=tk.W, pady=1)
         
         self.bunches_label = tk.Label(beam_frame, text="Bunches: 2556",
-                                     bg=self.colors['surface'], fg=self.colors['text_secondary'],
-                                     font=('SF Pro Display', 9))
+                                     bg=self.c_surface, fg=self.c_text_secondary,
+                                     font=self._font('SF Pro Display', 9))
         self.bunches_label.pack(anchor=tk.W, pady=1)
     
     def create_recent_events_card(self, parent, row, col):
@@ -883,158 +1422,276 @@ class ModernCERNMonitor:
         card = self.create_modern_card(parent, row, col)
         
         tk.Label(card, text="📡 Recent Events",
-                bg=self.colors['surface'], fg=self.colors['text_primary'],
-                font=('SF Pro Display', 12, 'bold')).pack(pady=(15, 10))
+                bg=self.c_surface, fg=self.c_text_primary,
+                font=self._font('SF Pro Display', 12, 'bold')).pack(pady=(15, 10))
         
-        events_frame = tk.Frame(card, bg=self.colors['surface'])
+        events_frame = tk.Frame(card, bg=self.c_surface)
         events_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=(0, 15))
         
         self.recent_events_labels = []
         for i in range(5):
             label = tk.Label(events_frame, text="",
-                           bg=self.colors['surface'], fg=self.colors['text_secondary'],
-                           font=('SF Pro Display', 8))
+                           bg=self.c_surface, fg=self.c_text_secondary,
+                           font=self._font('SF Pro Display', 8))
             label.pack(anchor=tk.W, pady=1)
             self.recent_events_labels.append(label)
     
     def create_enhanced_jobs_table(self, parent):
         """Enhanced jobs table with modern styling"""
         # Card container
-        table_card = tk.Frame(parent, bg=self.colors['surface'], relief='flat')
+        table_card = tk.Frame(parent, bg=self.c_surface, relief='flat')
         table_card.pack(fill=tk.BOTH, expand=True)
         
         # Top accent
-        accent_line = tk.Frame(table_card, bg=self.colors['primary'], height=2)
+        accent_line = tk.Frame(table_card, bg=self.c_primary, height=2)
         accent_line.pack(fill=tk.X, side=tk.TOP)
         
         # Header
-        header_frame = tk.Frame(table_card, bg=self.colors['surface'])
+        header_frame = tk.Frame(table_card, bg=self.c_surface)
         header_frame.pack(fill=tk.X, padx=20, pady=(15, 10))
         
         tk.Label(header_frame, text="🗄️ Jobs Database",
-                bg=self.colors['surface'], fg=self.colors['text_primary'],
-                font=('SF Pro Display', 14, 'bold')).pack(side=tk.LEFT)
+                bg=self.c_surface, fg=self.c_text_primary,
+                font=self._font('SF Pro Display', 14, 'bold')).pack(side=tk.LEFT)
         
         # Refresh button with modern styling
         refresh_btn = tk.Button(header_frame, text="↻ Refresh",
                                command=self.refresh_jobs_display,
-                               bg=self.colors['primary'], fg=self.colors['bg'],
-                               font=('SF Pro Display', 10, 'bold'),
+                               bg=self.c_primary, fg=self.c_bg,
+                               font=self._font('SF Pro Display', 10, 'bold'),
                                relief='flat', bd=0, padx=15, pady=5,
                                cursor='hand2')
         refresh_btn.pack(side=tk.RIGHT)
         
         # Table container with scrolling
-        table_container = tk.Frame(table_card, bg=self.colors['surface'])
+        table_container = tk.Frame(table_card, bg=self.c_surface)
         table_container.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 15))
         
         # Scrollbar
-        scrollbar = ttk.Scrollbar(table_container)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        # Enhanced treeview
-        self.jobs_tree = ttk.Treeview(table_container,
-                                     style='Modern.Treeview',
-                                     columns=('Status', 'Progress', 'Events', 'Errors', 'Duration', 'Start Time'),
-                                     show='tree headings',
-                                     yscrollcommand=scrollbar.set)
-        
-        # Configure columns with physics terminology
-        self.jobs_tree.heading('#0', text='Job Name')
-        self.jobs_tree.heading('Status', text='Status')
-        self.jobs_tree.heading('Progress', text='Progress')
-        self.jobs_tree.heading('Events', text='Events')
-        self.jobs_tree.heading('Errors', text='Errors')
-        self.jobs_tree.heading('Duration', text='Duration')
-        self.jobs_tree.heading('Start Time', text='Start Time')
-        
-        self.jobs_tree.column('#0', width=200)
-        self.jobs_tree.column('Status', width=120)
-        self.jobs_tree.column('Progress', width=80)
-        self.jobs_tree.column('Events', width=80)
-        self.jobs_tree.column('Errors', width=80)
-        self.jobs_tree.column('Duration', width=100)
-        self.jobs_tree.column('Start Time', width=150)
-        
-        self.jobs_tree.pack(fill=tk.BOTH, expand=True)
-        scrollbar.config(command=self.jobs_tree.yview)
+        self.jobs_scrollbar = ttk.Scrollbar(table_container, command=self._jobs_yview)
+        self.jobs_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        # Column headings with physics terminology
+        header = tk.Canvas(table_container, height=self.JOB_ROW_H,
+                           bg=self.c_surface_light, highlightthickness=0)
+        header.pack(fill=tk.X)
+        self._job_col_x = list(itertools.accumulate((w for _, w in self.JOB_COLUMNS), initial=0))
+        for (title, _), x in zip(self.JOB_COLUMNS, self._job_col_x):
+            header.create_text(x + 8, self.JOB_ROW_H // 2, text=title, anchor=tk.W,
+                               fill=self.c_text_primary, font=self._font('SF Pro Display', 11, 'bold'))
+        
+        # Virtual list: text items exist only for the visible rows and are
+        # re-texted on scroll, so the cost is O(visible) however many jobs exist
+        self.jobs_canvas = tk.Canvas(table_container, bg=self.c_surface, highlightthickness=0)
+        self.jobs_canvas.pack(fill=tk.BOTH, expand=True)
+        self.jobs_canvas.bind('<Configure>', self._layout_job_rows)
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self.jobs_canvas.bind(sequence, self._jobs_wheel)
+        self._job_rows = []     # formatted rows, newest first
+        self._jobs_first = 0    # index of the top visible row
+        self._row_items = []    # per visible slot: one text item id per column
+        self._row_shown = {}    # slot -> row tuple it currently displays
+        self._blank_row = ('',) * len(self.JOB_COLUMNS)
+        self._job_row_cache = {}  # job id -> formatted row
+        self._job_order = []    # job ids, newest first
+        self._job_pos = {}      # job id -> its index in _job_order / _job_rows
+    
+    def _layout_job_rows(self, event=None):
+        """Create text items for as many row slots as the canvas can show"""
+        canvas = self.jobs_canvas
+        needed = math.ceil(canvas.winfo_height() / self.JOB_ROW_H) + 1
+        while len(self._row_items) < needed:
+            y = len(self._row_items) * self.JOB_ROW_H + self.JOB_ROW_H // 2
+            self._row_items.append([canvas.create_text(x + 8, y, text='', anchor=tk.W,
+                                                       fill=self.c_text_primary,
+                                                       font=self._font('SF Pro Display', 10))
+                                    for x in self._job_col_x[:-1]])
+        self._paint_job_rows()
+    
+    def _paint_job_rows(self):
+        """Show rows [first, first + slots) in the fixed slots, one Tcl call"""
+        rows = self._job_rows
+        visible = max(1, self.jobs_canvas.winfo_height() // self.JOB_ROW_H)
+        first = self._jobs_first = max(0, min(self._jobs_first, len(rows) - visible))
+        blank = self._blank_row
+        shown = self._row_shown
+        args = []
+        for i, items in enumerate(self._row_items):
+            row = rows[first + i] if first + i < len(rows) else blank
+            if shown.get(i) is row:  # same cells already in this slot
+                continue
+            shown[i] = row
+            for item, text in zip(items, row):
+                args += (item, text)
+        if args:
+            self.root.tk.call('::cern_canvas_text', self.jobs_canvas._w, *args)
+        if rows:
+            self.jobs_scrollbar.set(first / len(rows), min(1.0, (first + visible) / len(rows)))
+        else:
+            self.jobs_scrollbar.set(0, 1)
+    
+    def _jobs_yview(self, *args):
+        """Scrollbar command: moves the window over _job_rows instead of scrolling items"""
+        if args[0] == 'moveto':
+            self._jobs_first = int(float(args[1]) * len(self._job_rows))
+        elif args[0] == 'scroll':
+            step = int(args[1])
+            if args[2] == 'pages':
+                step *= max(1, self.jobs_canvas.winfo_height() // self.JOB_ROW_H)
+            self._jobs_first += step
+        self._paint_job_rows()
+    
+    def _jobs_wheel(self, event):
+        """Mouse wheel over the jobs table (X11 reports buttons 4/5, others a delta)"""
+        up = event.num == 4 or event.delta > 0
+        self._jobs_yview('scroll', -3 if up else 3, 'units')
     
     def start_particle_animation(self):
         """Start subtle particle animation"""
-        def animate():
-            while self.monitoring:
-                try:
-                    # Animate header particle
-                    new_particle = random.choice(self.particles)
-                    self.root.after(0, lambda: self.particle_label.config(text=new_particle))
-                    
-                    # Rotate physics constants
-                    const_name = random.choice(list(self.physics_constants.keys()))
-                    const_value = self.physics_constants[const_name]
-                    self.root.after(0, lambda: self.physics_label.config(text=f"{const_name} = {const_value}"))
-                    
-                    time.sleep(5)  # Change every 5 seconds
-                except:
-                    break
-        
-        animation_thread = threading.Thread(target=animate, daemon=True)
-        animation_thread.start()
+        self._tick_particle()
+    
+    def _tick_particle(self):
+        """Rotate the header particle and physics constant, then re-arm (pure Tk timer)"""
+        if not self.monitoring:
+            return
+        try:
+            # Animate header particle
+            self.particle_label.config(text=next(self._particle_iter))
+            
+            # Rotate physics constants
+            const_name, const_value = next(self._constant_iter)
+            self._set_text(self.physics_label, f"{const_name} = {const_value}")
+        except tk.TclError:
+            return
+        self.root.after(5000, self._tick_particle)  # Change every 5 seconds
+    
+    BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
     
     def format_bytes(self, bytes_value):
-        """Convert bytes to human readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_value < 1024.0:
-                return f"{bytes_value:.1f} {unit}"
-            bytes_value /= 1024.0
-        return f"{bytes_value:.1f} PB"
-    
-    def animate_progress_bar(self, bar, target_width):
+        """Convert bytes to human readable format (unit picked from the bit length, no loop)"""
+        if bytes_value < 1024:
+            return f"{bytes_value:.1f} B"
+        exp = min((int(bytes_value).bit_length() - 1) // 10, 5)
+        return f"{bytes_value / (1 << (10 * exp)):.1f} {self.BYTE_UNITS[exp]}"
+    
+    def _font(self, family, size, weight='normal'):
+        """Named Tk font for a spec, created once: widgets then skip font-tuple parsing"""
+        key = (family, size, weight)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = tkfont.Font(root=self.root, family=family,
+                                                  size=size, weight=weight)
+        return font
+    
+    def create_progress_bar(self, parent, color):
+        """Progress bar as one canvas rectangle (no geometry-manager pass per update)"""
+        canvas = tk.Canvas(parent, height=8, bg=self.c_bg, highlightthickness=0)
+        rect = canvas.create_rectangle(0, 0, 0, 8, fill=color, outline='')
+        canvas.bind('<Configure>', lambda e: self._bar_widths.__setitem__(canvas, e.width))
+        return canvas, rect
+    
+    def animate_progress_bar(self, canvas, rect, fraction):
         """Smooth progress bar animation"""
         try:
-            if bar.winfo_exists():
-                bar.place_configure(width=max(0, target_width))
+            canvas.coords(rect, 0, 0, max(0, fraction) * self._bar_widths.get(canvas, 0), 8)
         except:
             pass
     
+    def _set_text(self, widget, text):
+        """Queue a label text change for the next batched Tcl update"""
+        if getattr(widget, '_cached', None) == text:  # unchanged: no Tcl work at all
+            return
+        widget._cached = text
+        if not self._pending_text:
+            self.root.after_idle(self._flush_text)
+        self._pending_text += (widget._w, text)
+    
+    def _set_level_color(self, canvas, rect, label, color):
+        """Recolour a progress bar and its metric label only when the level band changes"""
+        if getattr(label, '_cached_fg', None) == color:
+            return
+        label._cached_fg = color
+        canvas.itemconfigure(rect, fill=color)
+        label.config(fg=color)
+    
+    def _flush_text(self):
+        """Apply every queued label text change in a single Tcl round-trip"""
+        pending, self._pending_text = self._pending_text, []
+        if pending:
+            self.root.tk.call('::cern_set_text', *pending)
+    
+    def _graph_items(self, canvas, color, fill_color):
+        """Canvas item ids of a graph, created once and only re-coordinated afterwards"""
+        items = self._graph_item_ids.get(canvas)
+        if items is None:
+            fill = (canvas.create_polygon(0, 0, 0, 0, 0, 0, fill=fill_color, outline="",
+                                          stipple="gray12", tags="graph")
+                    if fill_color else None)
+            # a single line: the stippled glow passes cost three rasterizations each
+            lines = [canvas.create_line(0, 0, 0, 0, fill=color, width=2, smooth=True,
+                                        tags="graph")]
+            items = self._graph_item_ids[canvas] = (fill, lines)
+        return items
+    
+    def _schedule_redraw(self):
+        """Coalesce graph redraws: any number of requests -> one paint at idle time"""
+        if self.current_tab != self.TAB_SYSTEM:  # every graph lives on the system tab
+            return
+        if not self._redraw_scheduled:
+            self._redraw_scheduled = True
+            self.root.after_idle(self._do_redraws)
+    
+    def _do_redraws(self):
+        """Paint the latest state of every graph"""
+        self._redraw_scheduled = False
+        self.draw_enhanced_graph(self.cpu_graph, self.cpu_history, self.c_primary)
+        self.draw_enhanced_graph(self.memory_graph, self.ram_history, self.c_accent)
+        self.draw_enhanced_graph(self.network_graph, self.net_history, self.c_secondary)
+        
+        # Update job resource graphs if job is active
+        if self.current_job_id:
+            self.draw_enhanced_graph(self.job_cpu_graph, self.job_cpu_history, self.c_primary)
+            self.draw_enhanced_graph(self.job_mem_graph, self.job_ram_history, self.c_accent)
+            self.draw_enhanced_graph(self.job_progress_graph, self.job_progress_history,
+                                     self.c_secondary)
+    
     def draw_enhanced_graph(self, canvas, data, color, fill_color=None):
-        """Draw enhanced graph with glow effects"""
+        """Draw a history as one antialiased line (plus an optional stippled fill)"""
         try:
-            canvas.delete("all")
-            
-            if len(data) < 2:
-                return
+            fill, lines = self._graph_items(canvas, color, fill_color)
             
             width = canvas.winfo_width()
             height = canvas.winfo_height()
             
-            if width <= 1 or height <= 1:
+            # Dirty check: nothing pushed and no resize since the last draw
+            state = (data.version, width, height)
+            if self._graph_state.get(canvas) == state:
+                return
+            self._graph_state[canvas] = state
+            
+            values = data.view()
+            n = len(values)
+            
+            if n < 2 or width <= 1 or height <= 1:
+                canvas.itemconfigure("graph", state="hidden")
                 return
             
             # Normalize data
-            max_val = max(data) if max(data) > 0 else 100
-            min_val = min(data)
+            max_val = float(values.max())
+            if max_val <= 0:
+                max_val = 100
+            min_val = float(values.min())
             range_val = max_val - min_val if max_val > min_val else 1
             
-            # Create smooth curve points
-            points = []
-            for i, value in enumerate(data):
-                x = (i / (len(data) - 1)) * width
-                y = height - ((value - min_val) / range_val) * height
-                points.extend([x, y])
+            # Create smooth curve points (interleaved x0, y0, x1, y1, ...)
+            out = self._graph_coords.get(canvas)
+            if out is None or out.size < 2 * n:  # one buffer per canvas, reused every frame
+                out = self._graph_coords[canvas] = np.empty(2 * data.cap, dtype=np.float64)
+            points = history_to_coords(values, width, height, min_val, range_val, out).tolist()
             
-            # Draw with glow effect
-            if len(points) >= 4:
-                # Filled area
-                if fill_color:
-                    area_points = points + [width, height, 0, height]
-                    canvas.create_polygon(area_points, fill=fill_color, outline="", stipple="gray12")
-                
-                # Glow layers
-                for i in range(3):
-                    canvas.create_line(points, fill=color, width=3-i, smooth=True, stipple='gray75')
-                
-                # Main line
-                canvas.create_line(points, fill=color, width=2, smooth=True)
+            # Move the existing items (fill, line) in one Tcl call
+            self.root.tk.call('::cern_graph_coords', canvas._w,
+                              '' if fill is None else fill, lines, points, width, height)
                 
         except Exception as e:
             print(f"Error drawing enhanced graph: {e}")
@@ -1043,13 +1700,13 @@ class ModernCERNMonitor:
         """Process job update with enhanced tracking"""
         try:
             job_name = message.get('name', 'Unknown Collision')
-            status = message.get('status', 'Unknown')
+            status = sys.intern(message.get('status', 'Unknown'))  # see __init__
             progress = message.get('progress', 0)
             details = message.get('details', {})
             timestamp = message.get('timestamp', time.time())
             
             # Create job ID for new jobs
-            if status in ['Starting', 'Initializing'] or self.current_job_id is None:
+            if status in self.JOB_STARTS or self.current_job_id is None:
                 self.current_job_id = f"{job_name}_{int(timestamp)}"
                 self.current_job_data = {
                     'name': job_name,
@@ -1063,284 +1720,320 @@ class ModernCERNMonitor:
                     'failed': details.get('Failed', 0),
                     'total': details.get('Total', details.get('Total Items', 0)),
                     'updates': [],
-                    'resource_snapshots': []
+                    'resource_snapshots': JobSeries(self.JOB_SERIES_CAP)
                 }
+                replaced = self.jobs_history.get(self.current_job_id)
+                if replaced is not None:
+                    self._count_job(replaced.get('status', ''), -1)
+                self._count_job(status, 1)
                 self.jobs_history[self.current_job_id] = self.current_job_data
+                if self.current_job_id not in self._recent_ids:
+                    self._recent_ids = heapq.nlargest(5, [*self._recent_ids, self.current_job_id],
+                                                      key=self._job_start)
+                self.append_job_event(self.current_job_id, {'new': self.current_job_data})
                 
                 # Capture initial resource state
                 self.job_start_resources = {
-                    'cpu': psutil.cpu_percent(),
-                    'memory': psutil.virtual_memory().percent,
+                    'cpu': self._last_cpu,
+                    'memory': self._last_mem,
                     'timestamp': timestamp
                 }
             
             # Update current job
             if self.current_job_id and self.current_job_id in self.jobs_history:
                 job_data = self.jobs_history[self.current_job_id]
-                job_data.update({
+                changes = {
                     'status': status,
                     'progress': progress,
                     'details': details,
                     'completed': details.get('Completed', job_data.get('completed', 0)),
                     'failed': details.get('Failed', job_data.get('failed', 0)),
                     'total': details.get('Total', details.get('Total Items', job_data.get('total', 0)))
-                })
+                }
+                self._set_job(self.current_job_id, **changes)
                 
                 # Add resource snapshot
-                current_cpu = psutil.cpu_percent()
-                current_memory = psutil.virtual_memory().percent
+                # reuse the tick's readings: a second cpu_percent() caller would
+                # reset psutil's shared interval and skew the system card
+                current_cpu = self._last_cpu
+                current_memory = self._last_mem
                 
-                job_data['resource_snapshots'].append({
+                snapshot = {
                     'timestamp': timestamp,
                     'cpu': current_cpu,
                     'memory': current_memory,
                     'progress': progress
-                })
+                }
+                self._job_series(job_data).append(timestamp, current_cpu, current_memory, progress)
                 
                 # Update job-specific resource histories
-                self.job_cpu_history.append(current_cpu)
-                self.job_ram_history.append(current_memory)
-                self.job_progress_history.append(progress)
+                self.job_cpu_history.push(current_cpu)
+                self.job_ram_history.push(current_memory)
+                self.job_progress_history.push(progress)
+                self._schedule_redraw()
                 
                 # Add update to history
-                job_data['updates'].append({
+                update = {
                     'timestamp': timestamp,
                     'status': status,
                     'progress': progress,
                     'details': details
-                })
+                }
+                self._append_capped(job_data['updates'], update)
+                
+                job_id = self.current_job_id
                 
                 # If job is finished
-                if status in ['Completed', 'Completed with Errors', 'Failed']:
-                    job_data['end_time'] = timestamp
+                if status in self.JOB_ENDS:
+                    self._set_job(job_id, end_time=timestamp)
+                    changes['end_time'] = timestamp
                     self.current_job_id = None
                     # Clear job-specific histories
                     self.job_cpu_history.clear()
                     self.job_ram_history.clear()
                     self.job_progress_history.clear()
                 
-                self.save_jobs_history()
+                self.append_job_event(job_id, {'set': changes, 'snapshot': snapshot,
+                                               'update': update})
                 
         except Exception as e:
             print(f"Error processing collision data: {e}")
     
-    def update_system_metrics(self):
-        """Update all system metrics"""
+    def update_system_metrics(self, snap):
+        """Update fast-cadence metrics: clock, CPU, memory, network, uptime, graphs"""
         try:
-            current_time = time.time()
-            time_delta = current_time - self.last_time
+            self._last_cpu = snap.cpu_pct
+            self._last_mem = snap.mem_pct
+            
+            current_time = snap.t
+            time_delta = snap.mono - self.last_time
             
             # Update time with physics flair
-            current_dt = datetime.now()
-            self.time_label.config(text=current_dt.strftime("%H:%M:%S.%f")[:-3])
+            # HH:MM:SS and the uptime only change once per second: format them then
+            sec = int(current_time)
+            if sec != self._clock_sec:
+                self._clock_sec = sec
+                self._clock_str = time.strftime("%H:%M:%S", time.localtime(sec))
+                uptime = max(0, sec - int(self.boot_time))
+                self._set_text(self.uptime_label, f"{uptime // 3600:02d}:{uptime // 60 % 60:02d}:{uptime % 60:02d}")
+            self._set_text(self.time_label, f"{self._clock_str}.{int((current_time - sec) * 1000):03d}")
             
             # CPU
-            cpu_percent = psutil.cpu_percent(interval=None)
-            self.cpu_history.append(cpu_percent)
-            
-            self.cpu_metric.config(text=f"{cpu_percent:.1f}%")
+            cpu_percent = snap.cpu_pct
+            self.cpu_history.push(cpu_percent)
             
-            cpu_bar_width = (cpu_percent / 100) * self.cpu_bg_bar.winfo_width()
-            self.animate_progress_bar(self.cpu_progress_bar, cpu_bar_width)
-            
-            # Dynamic color based on load
-            if cpu_percent > 80:
-                color = self.colors['error']
-            elif cpu_percent > 60:
-                color = self.colors['warning']
-            else:
-                color = self.colors['primary']
-            self.cpu_progress_bar.config(bg=color)
-            self.cpu_metric.config(fg=color)
-            
-            # CPU details
-            cpu_count = psutil.cpu_count()
-            try:
-                cpu_freq = psutil.cpu_freq()
-                freq_ghz = cpu_freq.current / 1000 if cpu_freq else 0
-                freq_text = f"Frequency: {freq_ghz:.2f} GHz"
-            except:
-                freq_text = "Frequency: Unknown"
-            
-            self.cpu_cores_label.config(text=f"Quantum Cores: {cpu_count}")
-            self.cpu_freq_label.config(text=freq_text)
+            self._set_text(self.cpu_metric, f"{cpu_percent:.1f}%")
             
             # Memory
-            memory = psutil.virtual_memory()
-            self.ram_history.append(memory.percent)
+            self.ram_history.push(snap.mem_pct)
             
-            self.memory_metric.config(text=f"{memory.percent:.1f}%")
+            self._set_text(self.memory_metric, f"{snap.mem_pct:.1f}%")
             
-            memory_bar_width = (memory.percent / 100) * self.memory_bg_bar.winfo_width()
-            self.animate_progress_bar(self.memory_progress_bar, memory_bar_width)
+            if self.current_tab == self.TAB_SYSTEM:
+                self._paint_levels()
             
-            # Memory color coding
-            if memory.percent > 85:
-                mem_color = self.colors['error']
-            elif memory.percent > 70:
-                mem_color = self.colors['warning']
-            else:
-                mem_color = self.colors['accent']
-            self.memory_progress_bar.config(bg=mem_color)
-            self.memory_metric.config(fg=mem_color)
-            
-            self.memory_used_label.config(text=f"Allocated: {self.format_bytes(memory.used)}")
-            self.memory_available_label.config(text=f"Available: {self.format_bytes(memory.available)}")
+            self._set_text(self.memory_used_label, f"Allocated: {self.format_bytes(snap.mem_used)}")
+            self._set_text(self.memory_available_label, f"Available: {self.format_bytes(snap.mem_avail)}")
             
             # Network
-            current_net_io = psutil.net_io_counters()
+            current_net_io = snap.net
             
-            if time_delta > 0:
-                bytes_sent = current_net_io.bytes_sent - self.last_net_io.bytes_sent
-                bytes_recv = current_net_io.bytes_recv - self.last_net_io.bytes_recv
-                
+            bytes_sent = current_net_io[0] - self.last_net_io[0]
+            bytes_recv = current_net_io[1] - self.last_net_io[1]
+            
+            if bytes_sent == 0 and bytes_recv == 0:
+                # idle interface (the common case): no rate maths, no formatting
+                self.net_history.push(0)
+                self._set_text(self.network_metric, "0.0 B/s")
+                self._set_text(self.upload_label, "↑ 0.0 B/s")
+                self._set_text(self.download_label, "↓ 0.0 B/s")
+            elif time_delta > 0:
                 upload_speed = bytes_sent / time_delta
                 download_speed = bytes_recv / time_delta
                 total_speed = upload_speed + download_speed
                 
-                self.net_history.append(total_speed / 1024)
+                self.net_history.push(total_speed / 1024)
                 
-                self.network_metric.config(text=f"{self.format_bytes(total_speed)}/s")
-                self.upload_label.config(text=f"↑ {self.format_bytes(upload_speed)}/s")
-                self.download_label.config(text=f"↓ {self.format_bytes(download_speed)}/s")
-            
-            # Storage
-            home_usage = psutil.disk_usage(os.path.expanduser("~"))
-            storage_percent = (home_usage.used / home_usage.total) * 100
-            
-            self.storage_metric.config(text=f"{storage_percent:.1f}%")
+                self._set_text(self.network_metric, f"{self.format_bytes(total_speed)}/s")
+                self._set_text(self.upload_label, f"↑ {self.format_bytes(upload_speed)}/s")
+                self._set_text(self.download_label, f"↓ {self.format_bytes(download_speed)}/s")
             
-            storage_bar_width = (storage_percent / 100) * self.storage_bg_bar.winfo_width()
-            self.animate_progress_bar(self.storage_progress_bar, storage_bar_width)
-            
-            # Storage color
-            if storage_percent > 90:
-                storage_color = self.colors['error']
-            elif storage_percent > 75:
-                storage_color = self.colors['warning']
-            else:
-                storage_color = self.colors['warning']
-            self.storage_progress_bar.config(bg=storage_color)
-            self.storage_metric.config(fg=storage_color)
+            # Update graphs (at the next idle slot)
+            self._schedule_redraw()
             
-            self.storage_used_label.config(text=f"Occupied: {self.format_bytes(home_usage.used)}")
-            self.storage_free_label.config(text=f"Available: {self.format_bytes(home_usage.free)}")
+            # Update counters
+            self.last_net_io = current_net_io
+            self.last_time = snap.mono
             
+        except Exception as e:
+            print(f"Error updating quantum metrics: {e}")
+    
+    def _paint_levels(self):
+        """Size and colour the CPU and memory bars from the last tick's readings"""
+        cpu_percent, mem_percent = self._last_cpu, self._last_mem
+        self.animate_progress_bar(self.cpu_bg_bar, self.cpu_progress_bar, cpu_percent / 100)
+        
+        # Dynamic color based on load
+        if cpu_percent > 80:
+            color = self.c_error
+        elif cpu_percent > 60:
+            color = self.c_warning
+        else:
+            color = self.c_primary
+        self._set_level_color(self.cpu_bg_bar, self.cpu_progress_bar, self.cpu_metric, color)
+        
+        self.animate_progress_bar(self.memory_bg_bar, self.memory_progress_bar, mem_percent / 100)
+        
+        # Memory color coding
+        if mem_percent > 85:
+            mem_color = self.c_error
+        elif mem_percent > 70:
+            mem_color = self.c_warning
+        else:
+            mem_color = self.c_accent
+        self._set_level_color(self.memory_bg_bar, self.memory_progress_bar, self.memory_metric, mem_color)
+    
+    def update_process_list(self, processes, process_count):
+        """Update the process card (medium cadence)"""
+        try:
             # Processes
-            processes = []
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent']):
-                try:
-                    proc_info = proc.info
-                    if proc_info['cpu_percent'] is not None and proc_info['cpu_percent'] > 0:
-                        processes.append(proc_info)
-                except:
-                    continue
-            
             processes.sort(key=lambda x: x['cpu_percent'], reverse=True)
-            total_processes = len(list(psutil.process_iter()))
             
-            self.process_count_metric.config(text=str(total_processes))
+            self._set_text(self.process_count_metric, str(process_count))
             
             for i, label in enumerate(self.process_labels):
                 if i < len(processes):
                     proc = processes[i]
                     name = proc['name'][:14] + "…" if len(proc['name']) > 14 else proc['name']
-                    label.config(text=f"{name:<16} {proc['cpu_percent']:>4.1f}%")
+                    self._set_text(label, f"{name:<16} {proc['cpu_percent']:>4.1f}%")
                 else:
-                    label.config(text="")
+                    self._set_text(label, "")
             
-            # System info
-            boot_time = psutil.boot_time()
-            uptime_seconds = time.time() - boot_time
-            hours = int(uptime_seconds // 3600)
-            minutes = int((uptime_seconds % 3600) // 60)
-            seconds = int(uptime_seconds % 60)
-            self.uptime_label.config(text=f"{hours:02d}:{minutes:02d}:{seconds:02d}")
+        except Exception as e:
+            print(f"Error updating quantum metrics: {e}")
+    
+    def update_slow_metrics(self, snap):
+        """Update slow-cadence metrics: storage, frequency, temperature, load"""
+        try:
+            # CPU details
+            if snap.cpu_freq_ghz is not None:
+                freq_text = f"Frequency: {snap.cpu_freq_ghz:.2f} GHz"
+            else:
+                freq_text = "Frequency: Unknown"
             
-            # Hostname
-            try:
-                self.hostname_label.config(text=f"Node: {socket.gethostname()}")
-            except:
-                pass
+            self._set_text(self.cpu_cores_label, f"Quantum Cores: {self.cpu_count}")
+            self._set_text(self.cpu_freq_label, freq_text)
             
-            # Temperature with physics units
-            try:
-                temps = psutil.sensors_temperatures()
-                if temps:
-                    temp_info = list(temps.values())[0][0]
-                    temp_k = temp_info.current + 273.15  # Convert to Kelvin
-                    self.temperature_label.config(text=f"Core Temp: {temp_info.current:.1f}°C ({temp_k:.1f}K)")
-                else:
-                    self.temperature_label.config(text="Core Temp: N/A")
-            except:
-                self.temperature_label.config(text="Core Temp: N/A")
+            # Storage
+            storage_percent = (snap.disk_used / snap.disk_total) * 100
             
-            # Load average
-            try:
-                load_avg = os.getloadavg()
-                self.load_label.config(text=f"Load Vector: {load_avg[0]:.2f}")
-            except:
-                self.load_label.config(text="Load Vector: N/A")
+            self._set_text(self.storage_metric, f"{storage_percent:.1f}%")
             
-            # Update graphs with glow effects
-            self.draw_enhanced_graph(self.cpu_graph, self.cpu_history, 
-                                   self.colors['primary'], self.colors['glow'])
-            self.draw_enhanced_graph(self.memory_graph, self.ram_history, 
-                                   self.colors['accent'], self.colors['glow'])
-            self.draw_enhanced_graph(self.network_graph, self.net_history, 
-                                   self.colors['secondary'], self.colors['glow'])
+            self.animate_progress_bar(self.storage_bg_bar, self.storage_progress_bar, storage_percent / 100)
             
-            # Update job resource graphs if job is active
-            if self.current_job_id:
-                self.draw_enhanced_graph(self.job_cpu_graph, self.job_cpu_history, 
-                                       self.colors['primary'], self.colors['glow'])
-                self.draw_enhanced_graph(self.job_mem_graph, self.job_ram_history, 
-                                       self.colors['accent'], self.colors['glow'])
-                self.draw_enhanced_graph(self.job_progress_graph, self.job_progress_history, 
-                                       self.colors['secondary'], self.colors['glow'])
+            # Storage color
+            if storage_percent > 90:
+                storage_color = self.c_error
+            elif storage_percent > 75:
+                storage_color = self.c_warning
+            else:
+                storage_color = self.c_warning
+            self._set_level_color(self.storage_bg_bar, self.storage_progress_bar, self.storage_metric, storage_color)
             
-            # Update counters
-            self.last_net_io = current_net_io
-            self.last_time = current_time
+            self._set_text(self.storage_used_label, f"Occupied: {self.format_bytes(snap.disk_used)}")
+            self._set_text(self.storage_free_label, f"Available: {self.format_bytes(snap.disk_free)}")
+            
+            # Hostname
+            self._set_text(self.hostname_label, f"Node: {self.hostname}")
+            
+            # Temperature with physics units
+            if snap.temp_c is not None:
+                temp_k = snap.temp_c + 273.15  # Convert to Kelvin
+                self._set_text(self.temperature_label, f"Core Temp: {snap.temp_c:.1f}°C ({temp_k:.1f}K)")
+            else:
+                self._set_text(self.temperature_label, "Core Temp: N/A")
+            
+            # Load average
+            if snap.load is not None:
+                self._set_text(self.load_label, f"Load Vector: {snap.load:.2f}")
+            else:
+                self._set_text(self.load_label, "Load Vector: N/A")
             
         except Exception as e:
             print(f"Error updating quantum metrics: {e}")
     
+    @classmethod
+    def _coalesce_job_messages(cls, batch):
+        """Collapse consecutive progress updates of one job into the latest; starts/ends are kept"""
+        lifecycle = cls.JOB_STARTS + cls.JOB_ENDS
+        merged = []
+        for message in batch:
+            prev = merged[-1] if merged else None
+            if (prev is None or prev.get('name') != message.get('name')
+                    or prev.get('status') in lifecycle or message.get('status') in lifecycle):
+                merged.append(message)
+                continue
+            # counters only grow: never let a stale message roll them back
+            prev_details = prev.get('details') or {}
+            details = dict(message.get('details') or {})
+            for key in ('Completed', 'Failed'):
+                old, new = prev_details.get(key), details.get(key)
+                if isinstance(old, (int, float)) and isinstance(new, (int, float, type(None))):
+                    details[key] = old if new is None else max(old, new)
+            merged[-1] = {**message, 'details': details}
+        return merged
+    
     def update_external_process_display(self):
         """Update enhanced job display"""
         try:
-            # Check for new messages
-            while not self.process_queue.empty():
-                try:
-                    message = self.process_queue.get_nowait()
-                    self.external_process_data.update(message)
-                    self.process_job_update(message)
-                except queue.Empty:
-                    break
+            # Take everything queued since the last tick (at most the ring's size):
+            # progress-only runs fold into one update and the card renders once
+            batch = list(self.process_queue.drain())
+            for message in batch:
+                self.external_process_data.update(message)
+            for message in self._coalesce_job_messages(batch):
+                self.process_job_update(message)
+            if batch:
+                self._collision_stale = self._jobs_stats_stale = self._jobs_view_stale = True
             
-            # Update display
+            # Only the visible tab is painted; show_tab catches the other one up
+            if self.current_tab == self.TAB_SYSTEM:
+                self._paint_collision_card()
+            elif self._jobs_view_stale:
+                self._jobs_view_stale = False
+                self.update_jobs_displays()
+            
+        except Exception as e:
+            print(f"Error updating collision display: {e}")
+    
+    def _paint_collision_card(self):
+        """Render the system tab's collision card (nothing to do on a tick without packets)"""
+        if not self._collision_stale:
+            return
+        self._collision_stale = False
+        try:
             data = self.external_process_data
             
-            self.job_name_label.config(text=data['name'])
-            self.job_status_label.config(text=data['status'])
+            self._set_text(self.job_name_label, data['name'])
+            self._set_text(self.job_status_label, data['status'])
             
             # Update progress with precision
             progress = data['progress']
-            self.job_progress_label.config(text=f"{progress:.2f}%")
+            self._set_text(self.job_progress_label, f"{progress:.2f}%")
             
-            progress_width = (progress / 100) * self.job_progress_bg.winfo_width()
-            self.animate_progress_bar(self.job_progress_bar, progress_width)
+            self.animate_progress_bar(self.job_progress_bg, self.job_progress_bar, progress / 100)
             
             # Update collision dot
             if data['status'].lower() in ['processing', 'running']:
-                dot_color = self.colors['success']
+                dot_color = self.c_success
             elif data['status'].lower() in ['error', 'failed']:
-                dot_color = self.colors['error']
+                dot_color = self.c_error
             else:
-                dot_color = self.colors['border']
+                dot_color = self.c_border
             
-            self.collision_dot.delete("all")
-            self.collision_dot.create_oval(1, 1, 11, 11, fill=dot_color, outline="")
+            if dot_color != self._dot_color:  # recolour the one oval, never recreate it
+                self._dot_color = dot_color
+                self.collision_dot.itemconfigure(self.collision_dot_item, fill=dot_color)
             
             # Update job metrics with physics terminology
             details = data.get('details', {})
@@ -1348,163 +2041,340 @@ class ModernCERNMonitor:
             failed = details.get('Failed', 0)
             eta = details.get('ETA', '∞')
             
-            self.job_completed_label.config(text=f"Events: {completed}")
-            self.job_failed_label.config(text=f"Errors: {failed}")
-            self.job_eta_label.config(text=f"ETA: {eta}")
-            
-            # Update jobs tab displays
-            self.update_jobs_displays()
+            self._set_text(self.job_completed_label, f"Events: {completed}")
+            self._set_text(self.job_failed_label, f"Errors: {failed}")
+            self._set_text(self.job_eta_label, f"ETA: {eta}")
             
         except Exception as e:
             print(f"Error updating collision display: {e}")
     
     def update_jobs_displays(self):
         """Update jobs tab displays"""
+        if not self._jobs_built:
+            return
         try:
-            # Calculate collision statistics
-            total_collisions = len(self.jobs_history)
-            successful_collisions = sum(1 for job in self.jobs_history.values() 
-                                       if job.get('status', '').startswith('Completed'))
-            failed_collisions = sum(1 for job in self.jobs_history.values() 
-                                  if job.get('status', '') == 'Failed')
-            efficiency = (successful_collisions / total_collisions * 100) if total_collisions > 0 else 0
-            
-            # Update stats
-            self.total_collisions_label.config(text=f"Total Runs: {total_collisions}")
-            self.successful_collisions_label.config(text=f"Successful: {successful_collisions}")
-            self.failed_collisions_label.config(text=f"Failed: {failed_collisions}")
-            self.efficiency_label.config(text=f"Efficiency: {efficiency:.1f}%")
+            if self._jobs_stats_stale:
+                self._jobs_stats_stale = False
+                self._update_jobs_stats()
             
             # Update active collision
             if self.current_job_id and self.current_job_id in self.jobs_history:
                 job_data = self.jobs_history[self.current_job_id]
-                self.active_collision_name.config(text=job_data.get('name', 'Unknown'))
-                self.collision_progress_label.config(text=f"Progress: {job_data.get('progress', 0):.1f}%")
+                self._set_text(self.active_collision_name, job_data.get('name', 'Unknown'))
+                self._set_text(self.collision_progress_label, f"Progress: {job_data.get('progress', 0):.1f}%")
                 
                 eta = job_data.get('details', {}).get('ETA', '∞')
-                self.collision_eta_label.config(text=f"ETA: {eta}")
+                self._set_text(self.collision_eta_label, f"ETA: {eta}")
                 
-                # Random beam energy from CERN ranges
-                energy = random.choice(self.lhc_energies)
-                self.beam_energy_label.config(text=f"Energy: {energy}")
+                # CERN beam energy, pinned per job
+                energy = self.lhc_energies[self._job_hash(self.current_job_id) % len(self.lhc_energies)]
+                self._set_text(self.beam_energy_label, f"Energy: {energy}")
             else:
-                self.active_collision_name.config(text="No active collision")
-                self.collision_progress_label.config(text="Progress: 0%")
-                self.collision_eta_label.config(text="ETA: ∞")
+                self._set_text(self.active_collision_name, "No active collision")
+                self._set_text(self.collision_progress_label, "Progress: 0%")
+                self._set_text(self.collision_eta_label, "ETA: ∞")
             
             # Update recent events
-            recent_jobs = sorted(self.jobs_history.values(), 
-                               key=lambda x: x.get('start_time', 0), reverse=True)[:5]
-            
             for i, label in enumerate(self.recent_events_labels):
-                if i < len(recent_jobs):
-                    job = recent_jobs[i]
-                    start_time = datetime.fromtimestamp(job.get('start_time', 0)).strftime("%H:%M")
-                    status = job.get('status', 'Unknown')
-                    particle = random.choice(['p', 'Pb', 'p+', 'e⁻'])  # Physics particles
-                    label.config(text=f"{start_time} {particle} collision • {status}")
-                else:
-                    label.config(text="")
+                self._set_text(label, self._recent_jobs[i] if i < len(self._recent_jobs) else "")
             
         except Exception as e:
             print(f"Error updating collision displays: {e}")
     
+    @staticmethod
+    def _job_hash(job_id):
+        """Stable per-job number for cosmetic picks (same across restarts, unlike hash())"""
+        return zlib.crc32(job_id.encode())
+    
+    def _count_job(self, status, sign):
+        """Add (sign=1) or remove (sign=-1) one job with *status* from the success/failure counts"""
+        if status.startswith('Completed'):
+            self._jobs_ok += sign
+        elif status == 'Failed':
+            self._jobs_failed += sign
+    
+    def _set_job(self, job_id, **fields):
+        """Update fields of a stored job, keeping the counts and its table row in step"""
+        job = self.jobs_history[job_id]
+        status = fields.get('status')
+        if status is not None and status != job.get('status', ''):
+            self._count_job(job.get('status', ''), -1)
+            self._count_job(status, 1)
+        job.update(fields)
+        self._dirty_jobs.add(job_id)
+    
+    def _job_start(self, job_id):
+        """Sort key: a job's start time"""
+        return self.jobs_history[job_id].get('start_time', 0)
+    
+    def _update_jobs_stats(self):
+        """Recount the jobs statistics and recent events (only after jobs changed)"""
+        # Collision statistics (maintained incrementally, see _count_job)
+        total_collisions = len(self.jobs_history)
+        successful_collisions = self._jobs_ok
+        failed_collisions = self._jobs_failed
+        efficiency = (successful_collisions / total_collisions * 100) if total_collisions > 0 else 0
+        
+        # Update stats
+        self._set_text(self.total_collisions_label, f"Total Runs: {total_collisions}")
+        self._set_text(self.successful_collisions_label, f"Successful: {successful_collisions}")
+        self._set_text(self.failed_collisions_label, f"Failed: {failed_collisions}")
+        self._set_text(self.efficiency_label, f"Efficiency: {efficiency:.1f}%")
+        
+        # Recent events: newest five, formatted once
+        self._recent_jobs = []
+        for job_id in self._recent_ids:
+            job = self.jobs_history[job_id]
+            start_time = datetime.fromtimestamp(job.get('start_time', 0)).strftime("%H:%M")
+            # Physics particle, pinned per job so the line only changes with its status
+            particle = self.beam_particles[self._job_hash(job_id) % len(self.beam_particles)]
+            self._recent_jobs.append(f"{start_time} {particle} collision • {job.get('status', 'Unknown')}")
+    
+    @staticmethod
+    def _format_duration(job_data):
+        """HH:MM:SS run time of a finished job, 'Ongoing' before its end_time is set"""
+        if not job_data.get('end_time'):
+            return "Ongoing"
+        duration_seconds = job_data['end_time'] - job_data.get('start_time', 0)
+        hours = int(duration_seconds // 3600)
+        minutes = int((duration_seconds % 3600) // 60)
+        seconds = int(duration_seconds % 60)
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+    
+    def _format_job_row(self, job_data, prev=None):
+        """Table cells of one job; cells that never change are taken from *prev*, its last row"""
+        if prev is None:
+            start_time = datetime.fromtimestamp(job_data.get('start_time', 0)).strftime("%Y-%m-%d %H:%M:%S")
+            
+            # Add physics flair to job names
+            name = job_data.get('name', 'Unknown')
+            if 'FT0' in name:
+                name = f"⚡ {name}"
+            elif 'FV0' in name:
+                name = f"🔬 {name}"
+            duration = self._format_duration(job_data)
+        else:
+            name, start_time = prev[0], prev[6]
+            # a finished job's duration is fixed once end_time is set
+            duration = prev[5] if prev[5] != "Ongoing" else self._format_duration(job_data)
+        
+        return (
+            name,
+            job_data.get('status', 'Unknown'),
+            f"{job_data.get('progress', 0):.1f}%",
+            str(job_data.get('completed', 0)),
+            str(job_data.get('failed', 0)),
+            duration,
+            start_time
+        )
+    
     def refresh_jobs_display(self):
         """Refresh enhanced jobs table"""
+        if not self._jobs_built:
+            return
         try:
-            # Clear existing items
-            for item in self.jobs_tree.get_children():
-                self.jobs_tree.delete(item)
+            cache = self._job_row_cache
+            dirty = self._dirty_jobs
+            # Jobs are only ever added and start times are fixed, so the order
+            # only needs rebuilding when the count changes
+            if len(cache) != len(self.jobs_history):
+                self._job_order = sorted(self.jobs_history, key=self._job_start, reverse=True)
+                self._job_pos = {job_id: i for i, job_id in enumerate(self._job_order)}
+                dirty.update(self.jobs_history.keys() - cache.keys())
+                self._job_rows = [cache.get(job_id) for job_id in self._job_order]
+            elif not dirty:
+                return
             
-            # Add jobs with enhanced display
-            for job_id, job_data in sorted(self.jobs_history.items(), 
-                                         key=lambda x: x[1].get('start_time', 0), reverse=True):
-                
-                start_time = datetime.fromtimestamp(job_data.get('start_time', 0)).strftime("%Y-%m-%d %H:%M:%S")
-                duration = "Ongoing"
-                
-                if job_data.get('end_time'):
-                    duration_seconds = job_data['end_time'] - job_data.get('start_time', 0)
-                    hours = int(duration_seconds // 3600)
-                    minutes = int((duration_seconds % 3600) // 60)
-                    seconds = int(duration_seconds % 60)
-                    duration = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-                
-                # Add physics flair to job names
-                name = job_data.get('name', 'Unknown')
-                if 'FT0' in name:
-                    name = f"⚡ {name}"
-                elif 'FV0' in name:
-                    name = f"🔬 {name}"
-                
-                self.jobs_tree.insert('', 'end',
-                                     text=name,
-                                     values=(
-                                         job_data.get('status', 'Unknown'),
-                                         f"{job_data.get('progress', 0):.1f}%",
-                                         job_data.get('completed', 0),
-                                         job_data.get('failed', 0),
-                                         duration,
-                                         start_time
-                                     ))
+            # Re-format only the rows _set_job touched since the last refresh
+            rows = self._job_rows
+            for job_id in dirty:
+                row = cache[job_id] = self._format_job_row(self.jobs_history[job_id],
+                                                           cache.get(job_id))
+                rows[self._job_pos[job_id]] = row
+            dirty.clear()
+            self._paint_job_rows()
         except Exception as e:
             print(f"Error refreshing collision database: {e}")
     
     def start_process_listener(self):
         """Start listening for collision data"""
-        def listener():
+        dropped = [0, float('-inf')]  # updates dropped since the last warning, its time
+        
+        def publish(data):
             try:
-                server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-                server_socket.bind(('localhost', 9999))
-                server_socket.listen(1)
-                
-                print("CERN Monitor listening for collision data on port 9999...")
-                
-                while self.monitoring:
+                if not self.process_queue.push(_loads(data)):
+                    # a full ring drops every update of a burst: warn once per interval
+                    dropped[0] += 1
+                    now = time.monotonic()
+                    if now - dropped[1] >= self.RING_FULL_LOG_S:
+                        self._log.warning("Collision data ring full, dropped %d update(s)", dropped[0])
+                        dropped[:] = 0, now
+            except ValueError:
+                self._log.warning("Invalid collision data received: %r", data[:200])
+        
+        async def handle(reader, writer):
+            # One long-lived connection per client carrying 4-byte big-endian
+            # length-prefixed JSON frames. Old clients send a single bare JSON
+            # object and close, recognisable by the leading '{'.
+            try:
+                while True:
                     try:
-                        server_socket.settimeout(1.0)
-                        client_socket, addr = server_socket.accept()
-                        
-                        data = client_socket.recv(1024).decode('utf-8')
-                        if data:
-                            try:
-                                message = json.loads(data)
-                                self.process_queue.put(message)
-                            except json.JSONDecodeError:
-                                print(f"Invalid collision data received: {data}")
-                        
-                        client_socket.close()
-                        
-                    except socket.timeout:
-                        continue
-                    except Exception as e:
-                        print(f"Error in collision listener: {e}")
-                        
-                server_socket.close()
-                
+                        head = await reader.readexactly(4)
+                    except asyncio.IncompleteReadError as e:
+                        if e.partial.startswith(b'{'):
+                            publish(e.partial)
+                        break
+                    if head.startswith(b'{'):
+                        publish(head + await reader.read())
+                        break
+                    size = int.from_bytes(head, 'big')
+                    if size > self.MAX_FRAME:
+                        self._log.warning("Collision frame of %d bytes refused, closing connection", size)
+                        break
+                    publish(await reader.readexactly(size))
+            except Exception as e:
+                self._log.warning("Error in collision listener: %s", e)
+            finally:
+                writer.close()
+        
+        class DatagramSink(asyncio.DatagramProtocol):
+            # local clients: one datagram is one message, no framing needed
+            def datagram_received(self, data, addr):
+                publish(data)
+        
+        async def listener():
+            if hasattr(socket, 'AF_UNIX'):
+                try:
+                    # a stale socket file from a previous run is replaced
+                    self._dgram, _ = await self._loop.create_datagram_endpoint(
+                        DatagramSink, local_addr=self.DGRAM_PATH, family=socket.AF_UNIX)
+                except Exception as e:
+                    self._log.warning("Failed to open %s, TCP only: %s", self.DGRAM_PATH, e)
+            try:
+                # each client is its own task, so a burst of workers only
+                # needs accept backlog; asyncio sets TCP_NODELAY on accepted sockets
+                self._server = await asyncio.start_server(handle, 'localhost', 9999,
+                                                          reuse_address=True, backlog=128)
+                self._log.info("CERN Monitor listening for collision data on port 9999...")
             except Exception as e:
-                print(f"Failed to start collision listener: {e}")
+                self._log.error("Failed to start collision listener: %s", e)
         
-        listener_thread = threading.Thread(target=listener, daemon=True)
-        listener_thread.start()
+        self._tasks.append(self._loop.create_task(listener()))
+    
+    def sample_tick(self):
+        """Take the fast-cadence readings (runs on the sampler thread)"""
+        t = time.time()
+        memory = psutil.virtual_memory()
+        return TickSnapshot(
+            t=t,
+            mono=time.monotonic(),
+            cpu_pct=psutil.cpu_percent(interval=None),
+            mem_pct=memory.percent,
+            mem_used=memory.used,
+            mem_avail=memory.available,
+            net=self._read_net_bytes(),
+        )
+    
+    def sample_processes(self):
+        """Per-process CPU usage and process count (runs on the sampler thread)"""
+        return self.proc_collector.sample()
+    
+    def _probe_sensors(self):
+        """Find out once which optional readings exist, so unsupported ones never raise per tick"""
+        try:
+            self._has_freq = bool(psutil.cpu_freq())
+        except Exception:
+            self._has_freq = False
+        try:
+            self._has_temps = bool(psutil.sensors_temperatures())
+        except Exception:  # AttributeError off Linux/FreeBSD, OSError without sensors
+            self._has_temps = False
+        try:
+            os.getloadavg()
+            self._has_load = True
+        except (AttributeError, OSError):
+            self._has_load = False
+    
+    def sample_slow(self):
+        """Take the slow-cadence readings (runs on the sampler thread)"""
+        freq_ghz = temp_c = load = None
+        if self._has_freq:
+            cpu_freq = psutil.cpu_freq()
+            freq_ghz = cpu_freq.current / 1000 if cpu_freq else 0
+        if self._has_temps:
+            sensors = next(iter(psutil.sensors_temperatures().values()), None)
+            temp_c = sensors[0].current if sensors else None
+        if self._has_load:
+            load = os.getloadavg()[0]
+        disk = psutil.disk_usage(self.home_dir)
+        return SlowSnapshot(
+            cpu_freq_ghz=freq_ghz,
+            disk_used=disk.used,
+            disk_total=disk.total,
+            disk_free=disk.free,
+            temp_c=temp_c,
+            load=load,
+        )
     
-    def monitor_loop(self):
-        """Main monitoring loop"""
+    async def monitor_loop(self):
+        """Fast loop: CPU, memory, network, graphs and job updates"""
         while self.monitoring:
             try:
-                self.root.after(0, self.update_system_metrics)
-                self.root.after(0, self.update_external_process_display)
-                time.sleep(1)
+                # /proc and psutil reads block: keep them off the Tk thread
+                snap = await self._loop.run_in_executor(self._sampler, self.sample_tick)
+                self.update_system_metrics(snap)
+                self.update_external_process_display()
+            except Exception as e:  # one failed tick must not stop the card for good
+                self._log.warning("Error in quantum monitoring loop: %s", e)
+            await asyncio.sleep(self.FAST_S)
+    
+    async def process_loop(self):
+        """Medium loop: the /proc walk for the process card"""
+        while self.monitoring:
+            try:
+                processes, count = await self._loop.run_in_executor(self._sampler, self.sample_processes)
+                self.update_process_list(processes, count)
+            except Exception as e:
+                self._log.warning("Error in process monitoring loop: %s", e)
+            await asyncio.sleep(self.PROCESS_S)
+    
+    async def slow_loop(self):
+        """Slow loop: disk usage, sensors, load average, frequency"""
+        while self.monitoring:
+            try:
+                snap = await self._loop.run_in_executor(self._sampler, self.sample_slow)
+                self.update_slow_metrics(snap)
             except Exception as e:
-                print(f"Error in quantum monitoring loop: {e}")
-                break
+                self._log.warning("Error in slow monitoring loop: %s", e)
+            await asyncio.sleep(self.SLOW_S)
+    
+    def _run_loop_once(self):
+        """Run the asyncio loop for one pass from inside the Tk event loop"""
+        self._loop.call_soon(self._loop.stop)
+        self._loop.run_forever()
+    
+    def _on_loop_ready(self, fd, mask):
+        """Tk file handler: an fd the asyncio loop waits on became ready"""
+        # I/O -> future -> task step needs a pass per hop; anything deeper
+        # waits for the next timed pump
+        for _ in range(self.LOOP_PASSES):
+            if self._loop.is_closed():
+                return
+            self._run_loop_once()
+    
+    def _pump(self):
+        """Periodic pass for asyncio timers (and everything, without a file handler)"""
+        if self._loop.is_closed():
+            return
+        self._run_loop_once()
+        self.root.after(self._pump_ms, self._pump)
     
     def start_monitoring(self):
         """Start quantum monitoring"""
         if self.monitoring:
-            monitor_thread = threading.Thread(target=self.monitor_loop, daemon=True)
-            monitor_thread.start()
+            for loop in (self.monitor_loop, self.process_loop, self.slow_loop):
+                self._tasks.append(self._loop.create_task(loop()))
+            self.root.after(self.PUMP_MS, self._pump)
             
             # Initial refresh
             self.root.after(1000, self.refresh_jobs_display)
@@ -1512,7 +2382,29 @@ class ModernCERNMonitor:
     def on_closing(self):
         """Handle application closing"""
         self.monitoring = False
-        self.save_jobs_history()
+        for task in self._tasks:
+            task.cancel()
+        if self._server is not None:
+            self._server.close()
+        if self._dgram is not None:
+            self._dgram.close()
+            try:
+                os.unlink(self.DGRAM_PATH)
+            except OSError:
+                pass
+        self._loop.run_until_complete(asyncio.gather(*self._tasks, return_exceptions=True))
+        self._loop.run_until_complete(self._loop.shutdown_default_executor())
+        if self._loop_fd is not None:
+            self.root.tk.deletefilehandler(self._loop_fd)
+        self._loop.close()
+        self.compact_jobs_history()
+        if self._jobs_log is not None:
+            self._jobs_log.close()
+        if self._net_fd is not None:
+            os.close(self._net_fd)
+            self._net_fd = None
+        self.proc_collector.close()
+        self._log_listener.stop()
         self.root.quit()
         self.root.destroy()
 
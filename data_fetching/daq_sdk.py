@@ -4,10 +4,16 @@ daq_sdk.py  –  tiny helper‑SDK for data‑acquisition jobs & dashboards
 """
 
 from __future__ import annotations
-import json, os, socket, time, psutil, shutil
-from dataclasses import dataclass, asdict
+import json, os, socket, struct, threading, time, shutil
+from dataclasses import dataclass, field
 from typing import Dict, Any, Mapping, Optional, Protocol
 
+try:                                   # C encoder, same JSON on the wire
+    from orjson import dumps as _dumps
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
 
 # ─────────────────────────── public “contract” ────────────────────────────
 class JobReporter(Protocol):
@@ -23,22 +29,34 @@ class ProgressPacket:
     status: str
     progress: float                    # 0–100
     details: Dict[str, Any]
-    ts: float = time.time()
+    ts: float = field(default_factory=time.time)
 
     def as_json(self) -> bytes:
-        return json.dumps(asdict(self)).encode()
+        # plain dict instead of asdict(): no recursive deep copy per packet
+        return _dumps({"name": self.name, "status": self.status, "progress": self.progress,
+                       "details": self.details, "ts": self.ts})
 
 
 # ───────────────────────────── dashboard pipe ─────────────────────────────
+# dashboard's local datagram socket: per user, in $XDG_RUNTIME_DIR if there is one
+DGRAM_PATH = (os.path.join(os.environ["XDG_RUNTIME_DIR"], "daq_monitor.sock")
+              if os.environ.get("XDG_RUNTIME_DIR")
+              else f"/tmp/daq_monitor-{os.getuid()}.sock")
+
+
 class DashboardSocket(JobReporter):
     """Binary‑compatible drop‑in replacement for your old DashboardClient."""
 
     def __init__(self, host: str = "localhost", port: int = 9999,
-                 job_name: str = "DAQ job"):
+                 job_name: str = "DAQ job", dgram_path: str = DGRAM_PATH):
         self.addr   = (host, port)
         self.job    = job_name
+        self.dgram_path = dgram_path
         self._sock: Optional[socket.socket] = None
         self._start = time.time()
+        self._retry_at = 0.0     # no reconnect attempt before this time
+        self._backoff  = 0.5
+        self._lock     = threading.Lock()   # one frame on the wire at a time
 
     # -------------------------------- convenience helpers
     def start(self, total_items: int, detector: str = "", **extra):
@@ -47,12 +65,13 @@ class DashboardSocket(JobReporter):
     def step(self, done: int, total: int, failed: int = 0, **extra):
         done_tot = done + failed
         pct      = 0 if total == 0 else done_tot / total * 100
-        elapsed  = time.time() - self._start
+        now      = time.time()
+        elapsed  = now - self._start
         eta      = (elapsed / done_tot * (total - done_tot)) if done_tot else 0
         self._send("Processing" if done_tot < total else "Finishing", pct, {
             **extra, "Completed": done, "Failed": failed, "ETA": f"{eta:.0f}s",
             "Elapsed": f"{elapsed:.0f}s", "Total": total
-        })
+        }, now)
 
     def finish(self, ok: int, failed: int, **extra):
         total = ok + failed
@@ -62,29 +81,89 @@ class DashboardSocket(JobReporter):
         self.close()
 
     # -------------------------------- core send
-    def _send(self, status: str, progress: float, details: Dict[str, Any]):
-        payload = ProgressPacket(self.job, status, progress, details).as_json()
-        try:
-            self._sock = socket.create_connection(self.addr, timeout=2)
-            self._sock.send(payload)
-        except OSError:
-            pass
-        finally:
-            if self._sock:
-                self._sock.close()
-
-    def close(self):  pass  # nothing persistent
+    def _open(self) -> socket.socket:
+        """AF_UNIX datagrams to a local dashboard (no IP stack, no framing), else TCP."""
+        if self.addr[0] == "localhost" and hasattr(socket, "AF_UNIX"):
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            sock.settimeout(2)
+            try:
+                sock.connect(self.dgram_path)
+                return sock
+            except OSError:        # dashboard without the datagram listener
+                sock.close()
+        sock = socket.create_connection(self.addr, timeout=2)
+        # small frames: don't let Nagle hold one back waiting for an ACK
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock
+
+    def _connect(self) -> Optional[socket.socket]:
+        """The persistent connection; reconnects with exponential back-off."""
+        if self._sock is None and time.monotonic() >= self._retry_at:
+            try:
+                self._sock = self._open()
+                self._backoff = 0.5
+            except OSError:        # dashboard not running: don't block every step
+                self._retry_at = time.monotonic() + self._backoff
+                self._backoff = min(self._backoff * 2, 30.0)
+        return self._sock
+
+    def _send(self, status: str, progress: float, details: Dict[str, Any],
+              ts: Optional[float] = None):
+        # one clock read per packet, shared with step()'s elapsed time
+        ts = time.time() if ts is None else ts
+        self._write(ProgressPacket(self.job, status, progress, details, ts).as_json())
+
+    def send(self, packet: Mapping[str, Any]) -> None:
+        """Send any JSON-serialisable *packet* (silently dropped while the dashboard is down)."""
+        self._write(_dumps(packet))
+
+    def _write(self, payload: bytes) -> None:
+        with self._lock:
+            for _ in range(2):     # one retry on a fresh connection
+                sock = self._connect()
+                if sock is None:
+                    return
+                try:
+                    if sock.type == socket.SOCK_DGRAM:   # one datagram == one packet
+                        sock.send(payload)
+                    else:                                # stream: length-prefixed
+                        sock.sendall(struct.pack("!I", len(payload)) + payload)
+                    return
+                except OSError:    # BrokenPipe / ConnectionReset: dashboard restarted
+                    self.close()
+
+    def close(self):
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
 
 
 # ─────────────────────────── optional rich metrics ────────────────────────
+SNAPSHOT_TTL = 1.0                     # seconds a resource snapshot is reused
+_snapshot: Dict[str, Any] = {"ts": float("-inf"), "val": {}}
+_HOME = os.path.expanduser("~")
+
+
 def collect_resource_snapshot() -> Dict[str, Any]:
-    """Host‑side resource metrics (lightweight, no psutil? → return {})"""
+    """Host‑side resource metrics (lightweight, no psutil? → return {})
+
+    Cached for SNAPSHOT_TTL, so callers reporting every step don't pay a
+    statvfs + /proc read each time. Every call gets its own copy: callers
+    may add to it (e.g. as a packet's details) without touching the cache.
+    """
+    now = time.monotonic()
+    if now - _snapshot["ts"] < SNAPSHOT_TTL:
+        return dict(_snapshot["val"])
     try:
-        cpu = psutil.cpu_percent()
+        # imported here: the dashboard socket half of this module is stdlib-only
+        import psutil
+        # the very first interval=None call has no earlier sample: it would read 0.0
+        first = _snapshot["ts"] == float("-inf")
+        cpu = psutil.cpu_percent(interval=0.1 if first else None)
         mem = psutil.virtual_memory().percent
-        net = psutil.net_io_counters()
-        disk = shutil.disk_usage(os.path.expanduser("~"))
-        return {
+        net = psutil.net_io_counters(pernic=False)
+        disk = shutil.disk_usage(_HOME)
+        val = {
             "CPU_%": cpu,
             "RAM_%": mem,
             "TX_MB": round(net.bytes_sent / 1e6, 1),
@@ -92,4 +171,6 @@ def collect_resource_snapshot() -> Dict[str, Any]:
             "DiskFree_GB": round(disk.free / 1e9, 1)
         }
     except Exception:
-        return {}
+        val = {}
+    _snapshot["ts"], _snapshot["val"] = now, val
+    return dict(val)
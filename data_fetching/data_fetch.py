@@ -5,7 +5,7 @@ data_fetch.py – bulk digit production from CTFs (with dashboard integration)
 Modified version that sends real-time updates to the system dashboard
 """
 from __future__ import annotations
-import argparse, concurrent.futures, datetime, pathlib, shutil, subprocess, sys
+import argparse, concurrent.futures, datetime, errno, fcntl, hashlib, json, multiprocessing, pathlib, shlex, shutil, subprocess, sys, tempfile, time
 from typing import Tuple, Optional
 import random
 import os
@@ -26,28 +26,72 @@ except ImportError:
     UPROOT_AVAILABLE = False
 
 # ───────────────────────── cache & integrity helpers ──────────────────────────
-def check_file_integrity(file_path: pathlib.Path, det: str) -> Tuple[bool, str, dict]:
+# basket decompression for the integrity samples (threads start on first use)
+_DECOMP = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+
+INTEGRITY_LEDGER = "integrity_ledger.jsonl"   # in LISTING_CACHE by default: cache files found valid
+
+def integrity_key(file_path: pathlib.Path, det: str) -> Optional[tuple]:
+    """(path, mtime_ns, size, det) of *file_path*, or None if it can't be stat()ed."""
+    try:
+        st = file_path.stat()
+    except OSError:
+        return None
+    # absolute: one ledger is shared by runs started from different directories
+    return (os.path.abspath(file_path), st.st_mtime_ns, st.st_size, det)
+
+def read_integrity_ledger(ledger: pathlib.Path) -> dict:
+    """Verdicts recorded in *ledger* by earlier runs: integrity_key -> result."""
+    memo = {}
+    try:
+        with open(ledger, "rb") as f:
+            for line in f:
+                try:
+                    key, result = json.loads(line)
+                except ValueError:      # torn line from an interrupted run
+                    continue
+                memo[tuple(key)] = tuple(result)
+    except OSError:
+        pass
+    return memo
+
+def record_integrity(ledger: pathlib.Path, key: tuple, result: tuple) -> None:
+    """Append a verdict to *ledger* if it is worth remembering (a full, passed check)."""
+    if result[0] and UPROOT_AVAILABLE:  # basic checks are only a stat() anyway
+        try:
+            ledger.parent.mkdir(parents=True, exist_ok=True)
+            with open(ledger, "a") as f:
+                f.write(json.dumps([key, result]) + "\n")
+        except OSError:                 # unwritable: remembered for this run only
+            pass
+
+def check_file_integrity(file_path: pathlib.Path, det: str,
+                         known: Optional[tuple] = None) -> Tuple[bool, str, dict]:
     """
     Check if a ROOT file has the expected structure and content
     Returns (is_valid, error_message, file_info)
+
+    *known* is the verdict main() remembered for this file's integrity_key;
+    it is returned as is, without opening the file again.
     """
+    if known is not None:
+        return known
+    try:
+        file_size = file_path.stat().st_size
+    except OSError:
+        return False, "File not found", {}
+    return _check_file_integrity(file_path, det, file_size)
+
+def _check_file_integrity(file_path: pathlib.Path, det: str, file_size: int) -> Tuple[bool, str, dict]:
+    """The uncached check of an existing file of *file_size* bytes."""
     if not UPROOT_AVAILABLE:
         # Basic check if uproot is not available
-        if not file_path.exists():
-            return False, "File not found", {}
-        
-        file_size = file_path.stat().st_size
         if file_size < 1024:  # Less than 1KB
             return False, f"File too small ({file_size} bytes)", {"size": file_size}
         
         return True, "OK (basic check only)", {"size": file_size}
     
     try:
-        # Check file exists and size
-        if not file_path.exists():
-            return False, "File not found", {}
-        
-        file_size = file_path.stat().st_size
         if file_size < 1024:  # Less than 1KB
             return False, f"File too small ({file_size} bytes)", {"size": file_size}
         
@@ -82,8 +126,12 @@ def check_file_integrity(file_path: pathlib.Path, det: str) -> Tuple[bool, str,
                 qtc_branch = f"{det_upper}DIGITSCH/{det_upper}DIGITSCH.QTCAmpl"
                 ch_branch = f"{det_upper}DIGITSCH/{det_upper}DIGITSCH.ChId"
                 
-                qtc_sample = tree[qtc_branch].array(library="np", entry_stop=min(10, num_entries))
-                ch_sample = tree[ch_branch].array(library="np", entry_stop=min(10, num_entries))
+                # both branches in one request, their baskets decompressed in parallel
+                sample = tree.arrays([qtc_branch, ch_branch], library="np",
+                                     entry_stop=min(10, num_entries),
+                                     decompression_executor=_DECOMP)
+                qtc_sample = sample[qtc_branch]
+                ch_sample = sample[ch_branch]
                 
                 # Check if we can flatten without errors
                 total_qtc_entries = sum(len(event) for event in qtc_sample)
@@ -105,30 +153,44 @@ def check_file_integrity(file_path: pathlib.Path, det: str) -> Tuple[bool, str,
     except Exception as e:
         return False, f"File access error: {e}", {}
 
+def cache_name(run_id: str, det: str) -> str:
+    """File name of a run's digits in the cache (detector in lower case)."""
+    return f"run_{run_id}_{det.lower()}digits.root"
+
+def scan_cache(cache_dir: pathlib.Path) -> frozenset:
+    """Names in *cache_dir*, read with one directory listing.
+
+    On EOS/Ceph each stat() is a network round trip: main() lists the cache
+    once and tells every run whether its file is there.
+    """
+    with os.scandir(cache_dir) as it:
+        return frozenset(e.name for e in it)
+
 def check_cache_for_run(run_id: str, det: str, cache_dir: pathlib.Path, 
-                       console: Console) -> Tuple[Optional[pathlib.Path], str]:
+                       console: Console, known: Optional[tuple] = None,
+                       in_cache: Optional[bool] = None) -> Tuple[Optional[pathlib.Path], str, Optional[tuple]]:
     """
     Check if a run exists in cache and is valid.
-    Returns (cache_file_path, status_message) where cache_file_path is None if not found/invalid
+    Returns (cache_file_path, status_message, verdict) where cache_file_path is None if not found/invalid
+    and verdict is the integrity result, if the file was checked.
+    *in_cache* is the answer from scan_cache(); None looks on disk.
     """
-    if not cache_dir or not cache_dir.exists():
-        return None, "Cache directory not available"
-    
-    # Look for cache file (case insensitive detector matching)
-    det_lower = det.lower()
-    cache_pattern = f"run_{run_id}_{det_lower}digits.root"
-    cache_file = cache_dir / cache_pattern
+    cache_file = cache_dir / cache_name(run_id, det) if cache_dir else None
+    if in_cache is None:
+        if not cache_dir or not cache_dir.exists():
+            return None, "Cache directory not available", None
+        in_cache = cache_file.exists()
     
-    if not cache_file.exists():
-        return None, f"Not found in cache"
+    if not in_cache:
+        return None, f"Not found in cache", None
     
     # Check integrity
-    is_valid, error_msg, info = check_file_integrity(cache_file, det)
+    verdict = is_valid, error_msg, info = check_file_integrity(cache_file, det, known)
     if not is_valid:
         console.print(f"[yellow]Cache file for run {run_id} is invalid: {error_msg}[/]")
-        return None, f"Invalid cache file: {error_msg}"
+        return None, f"Invalid cache file: {error_msg}", verdict
     
-    return cache_file, f"Valid cache file found ({info.get('size', 0)} bytes)"
+    return cache_file, f"Valid cache file found ({info.get('size', 0)} bytes)", verdict
 
 def use_cached_file(cache_file: pathlib.Path, digits_out: pathlib.Path, 
                    run_tag: str, det: str, console: Console) -> Tuple[bool, str]:
@@ -136,12 +198,10 @@ def use_cached_file(cache_file: pathlib.Path, digits_out: pathlib.Path,
     Try to use cached file via symlink, then copy, then fail.
     Returns (success, method_used)
     """
-    digits_out.mkdir(exist_ok=True)
     digits_dst = digits_out / f"{run_tag}_{det.lower()}digits.root"
     
-    # Remove existing file if present
-    if digits_dst.exists():
-        digits_dst.unlink()
+    # Remove existing file if present (digits_out itself is created once in main)
+    digits_dst.unlink(missing_ok=True)
     
     # Try symlink first
     try:
@@ -150,102 +210,293 @@ def use_cached_file(cache_file: pathlib.Path, digits_out: pathlib.Path,
     except Exception as e:
         console.print(f"[yellow]Symlink failed for {run_tag}: {e}[/]")
     
-    # Try copy as fallback
+    # Try copy as fallback (a reflink or in-kernel copy where the filesystem allows)
     try:
-        shutil.copy2(cache_file, digits_dst)
-        return True, "copy"
+        return True, clone_file(cache_file, digits_dst)
     except Exception as e:
         console.print(f"[yellow]Copy failed for {run_tag}: {e}[/]")
         return False, f"failed: {e}"
 
 # ───────────────────────── low-level helpers ──────────────────────────
-def collect_ctfs(alien_dir: str, out_lst: pathlib.Path, n_files: Optional[int] = None) -> Tuple[bool, str]:
-    """Run `alien_find DIR .root` and store absolute grid paths in *out_lst*."""
-    res = subprocess.run(["alien_find", alien_dir, ".root"],
-                         capture_output=True, text=True)
-    if res.returncode:
-        return False, res.stderr.strip()
+FICLONE = 0x40049409        # <linux/fs.h> _IOW(0x94, 9, int): share the source's extents
+COPY_CHUNK = 1 << 30        # bytes per copy_file_range() call
+
+def clone_file(src: pathlib.Path, dst: pathlib.Path) -> str:
+    """Copy *src* to *dst* as cheaply as the filesystem allows; returns the method used.
+
+    "reflink": FICLONE, no data is copied at all (Btrfs, XFS, ...).
+    "copy_file_range": the kernel copies, server-side on NFS 4.2.
+    "copy": shutil.copy2, where neither is available.
+    """
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            try:
+                fcntl.ioctl(fdst, FICLONE, fsrc.fileno())
+                method = "reflink"
+            except OSError:
+                while os.copy_file_range(fsrc.fileno(), fdst.fileno(), COPY_CHUNK):
+                    pass
+                method = "copy_file_range"
+        shutil.copystat(src, dst)       # same metadata as copy2
+        return method
+    except (OSError, AttributeError):   # refused, or no os.copy_file_range (non-Linux)
+        shutil.copy2(src, dst)
+        return "copy"
+
+def move_file(src: pathlib.Path, dst: pathlib.Path) -> None:
+    """Move *src* to *dst*: a rename when possible, else an in-kernel copy.
+
+    Across filesystems (e.g. work/ on tmpfs) shutil.copyfile uses sendfile()
+    on Linux; the copy lands under a temporary name and is renamed into
+    place, so a half-written digits file is never visible as *dst*.
+    """
+    try:
+        os.replace(src, dst)            # same device: metadata only
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+    tmp = dst.with_name(f".{dst.name}.part")
+    try:
+        shutil.copyfile(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    src.unlink()
+
+def alien_path(alien_dir: str) -> str:
+    """Grid path of *alien_dir* without the alien:// scheme or a trailing slash."""
+    if alien_dir.startswith("alien://"):
+        alien_dir = "/" + alien_dir[8:].lstrip("/")  # alien://x and alien:///x alike
+    return alien_dir.rstrip("/")
+
+BATCH_FIND_MIN_DEPTH = 4    # shallowest common parent listed in one go (/alice/data/YEAR/PERIOD)
+BATCH_FIND_MIN_RUNS = 8     # fewer runs: per-run listings are cheaper than a whole period's
+BATCH_FIND_LINES_PER_RUN = 5000  # more lines than this per wanted run: mostly other runs, give up
+FIND_BUFSIZE = 1 << 20      # alien_find stdout buffer: few read() calls for long listings
+LISTING_CACHE = pathlib.Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expanduser() / "lhc-fetch"
+LISTING_TTL = 3600          # seconds a stored alien_find listing is trusted
+
+def _listing_file(alien_dir: str) -> pathlib.Path:
+    return LISTING_CACHE / f"{hashlib.sha1(alien_dir.encode()).hexdigest()}.lst"
+
+def cached_listing(alien_dir: str, ttl: float = LISTING_TTL) -> Optional[list]:
+    """Grid paths stored for *alien_dir* by an earlier run, if younger than *ttl* seconds."""
+    f = _listing_file(alien_dir)
+    try:
+        if time.time() - f.stat().st_mtime < ttl:
+            return f.read_text().splitlines() or None   # empty: list the run again
+    except OSError:
+        pass
+    return None
 
-    lines = [f"alien://{p}" for p in res.stdout.splitlines() if p]
+def store_listing(alien_dir: str, paths: list) -> None:
+    """Remember *alien_dir*'s listing for cached_listing() (written atomically).
 
-    # Randomly select subset if n_files is specified
-    if n_files is not None and lines:
-        lines = random.sample(lines, min(n_files, len(lines)))
+    Empty listings are not stored: no files may well be a transient grid
+    hiccup, and the run is listed again next time.
+    """
+    if not paths:
+        return
+    f = _listing_file(alien_dir)
+    tmp = f.with_name(f".{f.name}.{os.getpid()}")
+    try:
+        LISTING_CACHE.mkdir(parents=True, exist_ok=True)
+        tmp.write_text("".join(f"{p}\n" for p in paths))
+        os.replace(tmp, f)
+    except OSError:                     # no writable cache: just list again next time
+        tmp.unlink(missing_ok=True)
+
+def collect_ctfs_batched(alien_dirs: list) -> Optional[dict]:
+    """One `alien_find` under the common parent of *alien_dirs*, split per directory.
+
+    Saves the grid-client start-up of one alien_find per run. Returns
+    {alien_path(dir): [grid paths]}, or None when the directories only share
+    a parent shallower than BATCH_FIND_MIN_DEPTH or the listing fails; the
+    caller then lists each run on its own, as it does for runs left empty.
+
+    The common parent (typically the period) also holds runs that are not
+    wanted. Batching is skipped for fewer than BATCH_FIND_MIN_RUNS runs, and
+    abandoned (None) once the listing exceeds BATCH_FIND_LINES_PER_RUN lines
+    per wanted run.
+    """
+    if len(alien_dirs) < BATCH_FIND_MIN_RUNS:
+        return None
+    found = {alien_path(d): [] for d in alien_dirs}
+    prefix = os.path.commonpath(list(found))
+    if prefix.count("/") < BATCH_FIND_MIN_DEPTH:
+        return None
+    max_lines = BATCH_FIND_LINES_PER_RUN * len(found)
+    with tempfile.TemporaryFile("w+") as err, \
+         subprocess.Popen(["alien_find", prefix, ".root"], stdout=subprocess.PIPE,
+                          stderr=err, text=True, bufsize=FIND_BUFSIZE) as proc:
+        for n, p in enumerate(proc.stdout, 1):
+            if n > max_lines:           # the parent is mostly other runs
+                proc.kill()
+                proc.wait()
+                return None
+            p = p.strip()
+            # nearest listed ancestor; files of runs not in the list are dropped
+            parent = p
+            while len(parent) > len(prefix):
+                parent = parent.rpartition("/")[0]
+                if parent in found:
+                    found[parent].append(p)
+                    break
+        if proc.wait():
+            return None
+    return found
 
-    out_lst.write_text("\n".join(lines) + ("\n" if lines else ""))
+def collect_ctfs(alien_dir: str, out_lst: pathlib.Path, n_files: Optional[int] = None) -> Tuple[bool, str]:
+    """Run `alien_find DIR .root` and store absolute grid paths in *out_lst*.
+
+    The listing is streamed into *out_lst* line by line; with *n_files* a
+    reservoir sample (Algorithm R) keeps only n_files paths in memory.
+    """
+    with tempfile.TemporaryFile("w+") as err, \
+         subprocess.Popen(["alien_find", alien_dir, ".root"], stdout=subprocess.PIPE,
+                          stderr=err, text=True, bufsize=FIND_BUFSIZE) as proc, \
+         out_lst.open("w") as out:
+        reservoir = []
+        seen = 0
+        for p in proc.stdout:
+            p = p.strip()
+            if not p:
+                continue
+            if n_files is None:
+                out.write(f"alien://{p}\n")
+                continue
+            # Randomly select subset if n_files is specified
+            seen += 1
+            if len(reservoir) < n_files:
+                reservoir.append(p)
+            elif (j := random.randrange(seen)) < n_files:
+                reservoir[j] = p
+        out.writelines(f"alien://{p}\n" for p in reservoir)
+        if proc.wait():
+            err.seek(0)
+            return False, err.read().strip()
     return True, ""
 
 def run_workflow(det: str, lst: pathlib.Path,
                  cwd: pathlib.Path, log: pathlib.Path) -> int:
     """Launch `o2-ctf-reader-workflow | o2-<det>-digits-writer-workflow` inside *cwd*."""
-    lst_for_cli = lst.name if cwd.samefile(lst.parent) else lst.resolve()
+    # the list normally sits in cwd: a pure path compare spares two stat() calls
+    lst_for_cli = lst.name if lst.parent == cwd or cwd.samefile(lst.parent) else lst.resolve()
 
-    reader = (f"o2-ctf-reader-workflow --ctf-input {lst_for_cli} "
-              f"--onlyDet {det} --copy-cmd no-copy --ctf-dict ccdb -b")
-    writer = f"o2-{det.lower()}-digits-writer-workflow --disable-mc -b"
-    cmd    = f"{reader} | {writer}"
+    reader = ["o2-ctf-reader-workflow", "--ctf-input", str(lst_for_cli),
+              "--onlyDet", det, "--copy-cmd", "no-copy", "--ctf-dict", "ccdb", "-b"]
+    writer = [f"o2-{det.lower()}-digits-writer-workflow", "--disable-mc", "-b"]
+    cmd    = f"{shlex.join(reader)} | {shlex.join(writer)}"
 
     with log.open("w") as lf:
         lf.write(f"# {datetime.datetime.utcnow():%F %T}  DET={det}\n")
         lf.write(f"# CWD: {cwd}\n# CMD: {cmd}\n\n")
-        proc = subprocess.Popen(cmd, shell=True, executable="/bin/bash",
-                                cwd=cwd, stdout=lf, stderr=subprocess.STDOUT)
-        proc.communicate()
-        lf.write(f"\n# exit code {proc.returncode}\n")
-        return proc.returncode
+        lf.flush()                      # header before the children's output
+        # reader | writer wired up here instead of through /bin/bash
+        p1 = None
+        try:
+            p1 = subprocess.Popen(reader, cwd=cwd, stdout=subprocess.PIPE, stderr=lf)
+            p2 = subprocess.Popen(writer, cwd=cwd, stdin=p1.stdout,
+                                  stdout=lf, stderr=subprocess.STDOUT)
+        except OSError as e:            # workflow not on $PATH / not executable / ENOMEM
+            if p1 is not None:          # reader started but has no consumer
+                p1.stdout.close()
+                p1.terminate()
+                p1.wait()
+            lf.write(f"{e}\n")
+            # the exit status bash used to report for the pipeline
+            rc = 127 if isinstance(e, FileNotFoundError) else 126
+            lf.write(f"\n# exit code {rc}\n")
+            return rc
+        p1.stdout.close()               # writer holds the only read end now
+        try:
+            rc_writer, rc_reader = p2.wait(), p1.wait()
+        except BaseException:           # Ctrl-C / pool shutdown: no orphaned workflows
+            for p in (p1, p2):
+                p.terminate()
+                p.wait()
+            raise
+        rc = rc_writer or rc_reader
+        lf.write(f"\n# exit code {rc}\n")
+        return rc
 
 # ───────────────────────── one-run pipeline ──────────────────────────
+class _Notes(list):
+    """Console stand-in for worker processes: keeps the markup for the parent to print"""
+    print = list.append
+
 def process_run(alien_dir: str, det: str,
                 workdir: pathlib.Path, digits_out: pathlib.Path,
                 cache_dir: Optional[pathlib.Path] = None,
-                console: Optional[Console] = None
-                ) -> Tuple[str, bool, str, str]:
-    """Full pipeline for a single AliEn directory. Returns (run_id, success, log_path, method)"""
-    if alien_dir.startswith("alien://"):
-        alien_dir = "/" + alien_dir[8:]      # drop scheme, keep leading slash
-
-    run_id   = pathlib.Path(alien_dir).name
+                console: Optional[Console] = None,
+                known_integrity: Optional[tuple] = None,
+                ctf_paths: Optional[list] = None,
+                in_cache: Optional[bool] = None
+                ) -> Tuple[str, bool, str, str, list, Optional[tuple]]:
+    """Full pipeline for a single AliEn directory.
+    Returns (run_id, success, log_path, method, notes, integrity)
+
+    Runs in a worker process: every argument must pickle, so leave *console*
+    unset there. Messages are then returned in *notes* and printed by the
+    parent, above its live progress bar instead of through it. *ctf_paths*,
+    the run's files from collect_ctfs_batched, replaces its own alien_find;
+    *in_cache*, from scan_cache(), spares the lookup in *cache_dir*.
+    *known_integrity* is the parent's remembered verdict for the cache file;
+    without one the file is checked and the verdict returned as *integrity*.
+    """
+    notes = _Notes()                    # handed back as a plain list: pickles by value
+    console = console or notes
+    alien_dir = alien_path(alien_dir)
+    run_id   = alien_dir.rsplit("/", 1)[-1]   # == Path(alien_dir).name
     run_tag  = f"run_{run_id}"
     run_tmp  = workdir / run_tag
     run_tmp.mkdir(parents=True, exist_ok=True)
 
     log_file = run_tmp / f"{run_tag}.log"
+    integrity = None
     
     # Check cache first
     if cache_dir:
-        cache_file, cache_status = check_cache_for_run(run_id, det, cache_dir, console or Console())
+        cache_file, cache_status, integrity = check_cache_for_run(run_id, det, cache_dir, console,
+                                                                  known_integrity, in_cache)
         if cache_file:
-            success, method = use_cached_file(cache_file, digits_out, run_tag, det, console or Console())
+            success, method = use_cached_file(cache_file, digits_out, run_tag, det, console)
             if success:
                 # Write a log entry about cache usage
                 log_file.write_text(f"# {datetime.datetime.utcnow():%F %T}  DET={det}\n"
                                   f"# Used cached file via {method}: {cache_file}\n"
                                   f"# Cache status: {cache_status}\n")
-                return run_id, True, str(log_file), f"cache-{method}"
+                return run_id, True, str(log_file), f"cache-{method}", list(notes), integrity
             else:
                 # Cache file exists but couldn't be used, log and continue with normal processing
-                if console:
-                    console.print(f"[yellow]Cache file exists for {run_id} but couldn't be used ({method}), falling back to normal processing[/]")
+                console.print(f"[yellow]Cache file exists for {run_id} but couldn't be used ({method}), falling back to normal processing[/]")
     
     # Normal processing pipeline
     lst_file = run_tmp / f"{run_tag}_ctf_full.lst"
     alien_dir = alien_dir # + "/raw"
 
-    ok, err = collect_ctfs(alien_dir, lst_file)
+    if ctf_paths is not None:
+        lst_file.write_text("".join(f"alien://{p}\n" for p in ctf_paths))
+        ok = True
+    else:
+        ok, err = collect_ctfs(alien_dir, lst_file)
+        if ok:
+            store_listing(alien_dir, [l[len("alien://"):] for l in lst_file.read_text().splitlines()])
     if not ok:
         log_file.write_text(f"alien_find failed for {alien_dir}\n{err}\n")
-        return run_id, False, str(log_file), "error"
+        return run_id, False, str(log_file), "error", list(notes), integrity
 
     rc = run_workflow(det, lst_file, run_tmp, log_file)
 
     # move / rename digits file (if produced) immediately
     digits_src = run_tmp / f"o2_{det.lower()}digits.root"
     if rc == 0 and digits_src.exists():
-        digits_out.mkdir(exist_ok=True)
         digits_dst = digits_out / f"{run_tag}_{det.lower()}digits.root"
-        shutil.move(digits_src, digits_dst)
+        move_file(digits_src, digits_dst)
 
-    return run_id, (rc == 0), str(log_file), "processed"
+    return run_id, (rc == 0), str(log_file), "processed", list(notes), integrity
 
 # ───────────────────────── CLI & driver ──────────────────────────
 def parse_cli() -> argparse.Namespace:
@@ -262,6 +513,14 @@ def parse_cli() -> argparse.Namespace:
                     help="Parent work dir (auto-timestamp if omitted)")
     ap.add_argument("--cache-dir", default=None,
                     help="Directory with cached digit files")
+    ap.add_argument("--integrity-ledger", default=None,
+                    help="File remembering cache files that passed the integrity "
+                         f"check (default: $XDG_CACHE_HOME/lhc-fetch/{INTEGRITY_LEDGER})")
+    ap.add_argument("--deep-integrity", action="store_true",
+                    help="Re-read every cache file with uproot, even if unchanged "
+                         "since it last passed")
+    ap.add_argument("--refresh-alien", action="store_true",
+                    help="Ignore stored alien_find listings and query the grid again")
     ap.add_argument("--no-dashboard", action="store_true",
                     help="Disable dashboard updates")
     return ap.parse_args()
@@ -286,13 +545,16 @@ def main() -> None:
 
     # Setup cache directory
     cache_dir = None
+    cache_index = None                  # names in cache_dir, listed once
     if args.cache_dir:
         cache_dir = pathlib.Path(args.cache_dir)
-        if not cache_dir.exists():
+        try:
+            cache_index = scan_cache(cache_dir)
+        except OSError:
             console.print(f"[yellow]Warning: Cache directory does not exist: {cache_dir}[/]")
             cache_dir = None
         else:
-            console.print(f"[blue]Using cache directory: {cache_dir}[/]")
+            console.print(f"[blue]Using cache directory: {cache_dir} ({len(cache_index)} files)[/]")
 
     # Read directories list
     try:
@@ -321,12 +583,18 @@ def main() -> None:
     
     try:
         workdir.mkdir(parents=True, exist_ok=True)
+        digits_out.mkdir(exist_ok=True)     # once here, not once per run
     except Exception as e:
         console.print(f"[red]⨯ Could not create work directory: {e}[/]")
         if dashboard:
             dashboard.send_update("Error", 0, {'Error': f'Could not create work directory: {e}'})
         sys.exit(1)
 
+    # Integrity verdicts from earlier runs, kept here in the parent: workers
+    # are told the verdict and hand back the ones they had to compute
+    integrity_ledger = pathlib.Path(args.integrity_ledger or LISTING_CACHE / INTEGRITY_LEDGER)
+    integrity_memo = read_integrity_ledger(integrity_ledger) if cache_dir else {}
+
     # Notify dashboard of start
     if dashboard:
         dashboard.start_processing(len(dirs), args.det)
@@ -354,30 +622,83 @@ def main() -> None:
 
     # Processing statistics
     ok = err = 0
-    cache_hits = copy_fallbacks = symlink_successes = processed_runs = 0
+    cache_hits = copy_fallbacks = reflinks = symlink_successes = processed_runs = 0
     current_run = ""
     
-    # Main processing loop
-    with progress, concurrent.futures.ThreadPoolExecutor(max_workers=args.jobs) as pool:
-
-        def _done_cb(fut: concurrent.futures.Future):
-            nonlocal ok, err, current_run, cache_hits, copy_fallbacks, symlink_successes, processed_runs
+    # Grid listings: reuse recent ones from earlier invocations, then one
+    # alien_find for every remaining run instead of one per run
+    listings = {}
+    if not args.refresh_alien:
+        for d in dirs:
+            paths = cached_listing(alien_path(d))
+            if paths is not None:
+                listings[alien_path(d)] = paths
+        if listings:
+            console.print(f"[blue]Reusing stored CTF listings for {len(listings)} runs[/]")
+    to_list = [d for d in dirs if alien_path(d) not in listings]
+    found = collect_ctfs_batched(to_list)
+    if found is not None:
+        console.print(f"[blue]Listed {sum(map(len, found.values()))} CTFs "
+                      f"for {len(found)} runs with one alien_find[/]")
+        for run_dir, paths in found.items():
+            if paths:                   # none found: the run does its own alien_find
+                store_listing(run_dir, paths)
+                listings[run_dir] = paths
+
+    # Main processing loop: worker processes (forkserver: small, clean parents
+    # to fork from) so run orchestration isn't serialised on one GIL
+    mp_context = multiprocessing.get_context("forkserver")
+    with progress, concurrent.futures.ProcessPoolExecutor(max_workers=args.jobs,
+                                                          mp_context=mp_context) as pool:
+
+        # Submit all jobs (the console stays here: it isn't picklable)
+        console.print(f"[blue]Submitting {len(dirs)} jobs to {args.jobs} workers...[/]")
+        
+        futures = {}                    # future -> (AliEn directory, cache file's integrity_key)
+        for i, d in enumerate(dirs):
             try:
-                run, success, log, method = fut.result()
+                run_dir = alien_path(d)
+                name = cache_name(run_dir.rsplit("/", 1)[-1], args.det)
+                in_cache = name in cache_index if cache_index is not None else None
+                key = (integrity_key(cache_dir / name, args.det)
+                       if cache_dir and in_cache is not False else None)
+                known = None if args.deep_integrity or key is None else integrity_memo.get(key)
+                futures[pool.submit(process_run, d, args.det, workdir, digits_out, cache_dir,
+                                    known_integrity=known,
+                                    ctf_paths=listings.get(run_dir),
+                                    in_cache=in_cache)] = d, key
+            except Exception as e:
+                console.print(f"[red]Error submitting job {i+1}: {e}[/]")
+                err += 1
+                progress.update(t_id, advance=1)
+        
+        # Book-keep results in completion order, all on this thread
+        for fut in concurrent.futures.as_completed(futures):
+            try:
+                run, success, log, method, notes, integrity = fut.result()
+                for note in notes:
+                    console.print(note)
+                key = futures[fut][1]
+                if integrity is not None and key is not None and integrity_memo.get(key) != integrity:
+                    integrity_memo[key] = integrity
+                    record_integrity(integrity_ledger, key, integrity)
                 
                 # Update method statistics
                 if method.startswith("cache-"):
                     cache_hits += 1
                     if method == "cache-symlink":
                         symlink_successes += 1
-                    elif method == "cache-copy":
+                    else:               # copy, copy_file_range or reflink
                         copy_fallbacks += 1
+                        reflinks += method == "cache-reflink"
                 elif method == "processed":
                     processed_runs += 1
                 
                 # Format method display
                 method_display = {
                     "cache-symlink": "[green]cache→link[/]",
+                    "cache-reflink": "[green]cache→reflink[/]",
+                    "cache-copy_file_range": "[yellow]cache→kcopy[/]",
                     "cache-copy": "[yellow]cache→copy[/]", 
                     "processed": "[blue]processed[/]",
                     "error": "[red]error[/]"
@@ -404,25 +725,10 @@ def main() -> None:
                 progress.update(t_id, advance=1)
                 
             except Exception as e:
-                console.print(f"[red]Error in callback: {e}[/]")
+                console.print(f"[red]Error in run {futures[fut][0]}: {e}[/]")
                 err += 1
                 progress.update(t_id, advance=1)
 
-        # Submit all jobs
-        console.print(f"[blue]Submitting {len(dirs)} jobs to {args.jobs} workers...[/]")
-        
-        for i, d in enumerate(dirs):
-            try:
-                fut = pool.submit(process_run, d, args.det, workdir, digits_out, cache_dir, console)
-                fut.add_done_callback(_done_cb)
-            except Exception as e:
-                console.print(f"[red]Error submitting job {i+1}: {e}[/]")
-                err += 1
-                progress.update(t_id, advance=1)
-        
-        # Wait for all jobs to complete
-        pool.shutdown(wait=True)
-
     # Final dashboard update
     if dashboard:
         dashboard.finish_processing(ok, err, args.det)
@@ -434,7 +740,7 @@ def main() -> None:
     
     # Cache statistics
     if cache_dir:
-        console.print(f"[dim]Cache hits: {cache_hits} (symlinks: {symlink_successes}, copies: {copy_fallbacks}), processed: {processed_runs}[/]")
+        console.print(f"[dim]Cache hits: {cache_hits} (symlinks: {symlink_successes}, copies: {copy_fallbacks}, of which reflinks: {reflinks}), processed: {processed_runs}[/]")
     
     console.print(f"[dim]All artefacts: {workdir}[/]")
     
@@ -5,11 +5,22 @@ Removes duplicate lines while preserving the order of first occurrence.
 """
 
 import argparse
+import os
+import shutil
 import sys
+import tempfile
 from pathlib import Path
 
+try:                                    # fast non-cryptographic hash for --low-memory
+    from xxhash import xxh3_64_intdigest as _digest
+except ImportError:
+    import hashlib
 
-def deduplicate_file(input_file, output_file=None, preserve_order=True):
+    def _digest(data):
+        return hashlib.blake2b(data, digest_size=8).digest()
+
+
+def deduplicate_file(input_file, output_file=None, preserve_order=True, low_memory=False):
     """
     Deduplicate paths in a file.
     
@@ -17,41 +28,51 @@ def deduplicate_file(input_file, output_file=None, preserve_order=True):
         input_file (str): Path to input file
         output_file (str, optional): Path to output file. If None, overwrites input file.
         preserve_order (bool): Whether to preserve order of first occurrence
+        low_memory (bool): Remember 64-bit hashes instead of the paths themselves
+            (a hash collision, ~n²/2^65, would drop a unique path)
     
     Returns:
         tuple: (original_count, deduplicated_count)
     """
     try:
-        # Read all lines from input file
-        with open(input_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        original_count = len(lines)
-        
-        if preserve_order:
-            # Use dict to preserve order (Python 3.7+) while removing duplicates
-            seen = {}
-            unique_lines = []
-            for line in lines:
-                stripped_line = line.strip()
-                if stripped_line and stripped_line not in seen:
-                    seen[stripped_line] = True
-                    unique_lines.append(line)
-        else:
-            # Use set for faster deduplication (doesn't preserve order)
-            unique_lines = list(set(line.strip() for line in lines if line.strip()))
-            unique_lines = [line + '\n' for line in unique_lines]
-        
-        deduplicated_count = len(unique_lines)
-        
         # Determine output file
         out_file = output_file if output_file else input_file
+        out_dir = os.path.dirname(os.path.abspath(out_file))
         
-        # Write deduplicated lines to output file
-        with open(out_file, 'w', encoding='utf-8') as f:
-            f.writelines(unique_lines)
+        # One streaming pass: only the unique paths are held in memory, and
+        # the result is renamed over out_file once complete (safe in place)
+        original_count = 0
+        seen = set()
+        with open(input_file, 'r', encoding='utf-8') as fin, \
+             tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=out_dir,
+                                         delete=False) as fout:
+            try:
+                for line in fin:
+                    original_count += 1
+                    stripped_line = line.strip()
+                    if not stripped_line:
+                        continue
+                    key = _digest(stripped_line.encode()) if low_memory else stripped_line
+                    if key not in seen:
+                        seen.add(key)
+                        # without order preservation lines are written normalised
+                        fout.write(line if preserve_order else stripped_line + '\n')
+            except BaseException:
+                os.unlink(fout.name)
+                raise
+        try:
+            try:
+                shutil.copymode(out_file, fout.name)  # temp files are created 0600
+            except FileNotFoundError:               # new file: what open() would have given it
+                umask = os.umask(0)
+                os.umask(umask)
+                os.chmod(fout.name, 0o666 & ~umask)
+            os.replace(fout.name, out_file)
+        except BaseException:                       # no tmp* file left behind in out_dir
+            os.unlink(fout.name)
+            raise
         
-        return original_count, deduplicated_count
+        return original_count, len(seen)
         
     except FileNotFoundError:
         print(f"Error: Input file '{input_file}' not found.", file=sys.stderr)
@@ -94,6 +115,13 @@ Examples:
         help='Do not preserve order of first occurrence (faster for large files)'
     )
     
+    parser.add_argument(
+        '--low-memory',
+        action='store_true',
+        help='Track 64-bit hashes instead of full paths (much less RAM for huge lists, '
+             'tiny collision risk)'
+    )
+    
     parser.add_argument(
         '-v', '--verbose',
         action='store_true',
@@ -111,7 +139,8 @@ Examples:
     original_count, deduplicated_count = deduplicate_file(
         args.input_file,
         args.output_file,
-        args.preserve_order
+        args.preserve_order,
+        args.low_memory
     )
     
     # Show results
@@ -25,10 +25,13 @@ quick-start docs.
 """
 from __future__ import annotations
 import argparse, datetime, json, os, sys, urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from dotenv import load_dotenv
@@ -43,10 +46,41 @@ TOKEN      = os.getenv(  # guest-read token good for ~1 week
     ""
 )
 PAGE_LIMIT = 600                       # Bookkeeping pagination
+PAGE_WORKERS = 8                       # pages requested concurrently
+
+# one keep-alive pool for every page: no TCP+TLS handshake per request. The
+# certificate is verified (REQUESTS_CA_BUNDLE points at a custom CA if needed).
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4, pool_maxsize=PAGE_WORKERS,
+    max_retries=Retry(total=3, backoff_factor=0.3, allowed_methods={"GET"},
+                      status_forcelist=[429, 500, 502, 503, 504])))
 
 console = Console()
 
 # ──────────────────────────── bookkeeping helper ──────────────────────────
+def fetch_page(params: Dict, offset: int) -> Dict:
+    """One page of a /runs query (*params* is shared between threads, so copied)."""
+    query = {**params, "page[offset]": offset}
+    url = f"{API_BASE}/runs?{urllib.parse.urlencode(query, safe='[]')}"
+    resp = SESSION.get(url, timeout=30)
+    resp.raise_for_status()
+    return resp.json()
+
+
+def fetch_pages(params: Dict) -> List[Dict]:
+    """
+    Every page of a /runs query, in order. The first page reveals the page
+    count; the others are then fetched concurrently (~2 RTTs instead of one
+    per page).
+    """
+    first = fetch_page(params, 0)
+    page_count = first["meta"]["page"]["pageCount"]
+    with ThreadPoolExecutor(max_workers=PAGE_WORKERS) as ex:
+        return [first, *ex.map(lambda i: fetch_page(params, i * PAGE_LIMIT),
+                               range(1, page_count))]
+
+
 def fetch_laser_runs() -> List[Dict[str, int]]:
     """
     Return a list of {"run": <runNumber>, "start_ms": <epoch ms>} dicts.
@@ -64,7 +98,6 @@ def fetch_laser_runs() -> List[Dict[str, int]]:
         "filter[runDuration][operator]": "<=",
         "filter[runDuration][limit]": 61000,
         "page[limit]": PAGE_LIMIT,
-        "page[offset]": 0,
         "token": TOKEN,
     }
     runs: List[Dict[str, int]] = []
@@ -73,10 +106,7 @@ def fetch_laser_runs() -> List[Dict[str, int]]:
                   console=console) as pbar:
         task = pbar.add_task("Querying Bookkeeping …", total=None)
 
-        while True:
-            url = f"{API_BASE}/runs?{urllib.parse.urlencode(params, safe='[]')}"
-            data = requests.get(url, timeout=30, verify=False).json()
-
+        for data in fetch_pages(params):
             for entry in data["data"]:
                 # if entry.get("lhcBeamMode") != "RAMP DOWN":
                 #     continue
@@ -94,11 +124,6 @@ def fetch_laser_runs() -> List[Dict[str, int]]:
                         "beamType": beamType
                     })
 
-            cur_page = params["page[offset]"] // PAGE_LIMIT + 1
-            if cur_page >= data["meta"]["page"]["pageCount"]:
-                break
-            params["page[offset]"] += PAGE_LIMIT
-
         pbar.update(task, description=f"Fetched {len(runs)} runs ✔", completed=1)
     return runs
 
@@ -110,7 +135,6 @@ def fetch_oxygen_runs() -> List[Dict[str, int]]:
         "filter[runTypes][]":          "1",
         "filter[runQualities]":        "good",
         "page[limit]":                 PAGE_LIMIT,
-        "page[offset]":                0,
         "token":                       TOKEN,
     }
     runs: List[Dict[str, int]] = []
@@ -119,10 +143,7 @@ def fetch_oxygen_runs() -> List[Dict[str, int]]:
                   console=console) as pbar:
         task = pbar.add_task("Querying Bookkeeping …", total=None)
 
-        while True:
-            url = f"{API_BASE}/runs?{urllib.parse.urlencode(params, safe='[]')}"
-            data = requests.get(url, timeout=30, verify=False).json()
-
+        for data in fetch_pages(params):
             for entry in data["data"]:
                 # if entry.get("lhcBeamMode") != "RAMP DOWN":
                 #     continue
@@ -139,11 +160,6 @@ def fetch_oxygen_runs() -> List[Dict[str, int]]:
                         "beamType": beamType
                     })
 
-            cur_page = params["page[offset]"] // PAGE_LIMIT + 1
-            if cur_page >= data["meta"]["page"]["pageCount"]:
-                break
-            params["page[offset]"] += PAGE_LIMIT
-
         pbar.update(task, description=f"Fetched {len(runs)} runs ✔", completed=1)
     return runs
 
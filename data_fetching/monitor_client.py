@@ -4,36 +4,34 @@ monitor_client.py - Communication helper for sending updates to the system dashb
 Add this to your data_fetch.py script to enable real-time monitoring
 """
 
-import socket
-import json
 import time
 from typing import Dict, Any, Optional
 
+from daq_sdk import DGRAM_PATH, DashboardSocket
+
 class DashboardClient:
-    def __init__(self, host='localhost', port=9999):
+    def __init__(self, host='localhost', port=9999, dgram_path=DGRAM_PATH):
         self.host = host
         self.port = port
         self.process_name = "Data Processing Job"
         self.start_time = time.time()
+        # persistent connection, framing and reconnect back-off are the SDK's
+        self._conn = DashboardSocket(host, port, dgram_path=dgram_path)
+    
+    def close(self):
+        """Close the dashboard connection"""
+        self._conn.close()
         
     def send_update(self, status: str, progress: float = 0, details: Optional[Dict[str, Any]] = None):
         """Send status update to dashboard"""
         try:
-            message = {
+            self._conn.send({
                 'name': self.process_name,
                 'status': status,
                 'progress': progress,
                 'details': details or {},
                 'timestamp': time.time()
-            }
-            
-            # Send via socket
-            client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            client_socket.settimeout(2.0)
-            client_socket.connect((self.host, self.port))
-            client_socket.send(json.dumps(message).encode('utf-8'))
-            client_socket.close()
-            
+            })
         except Exception as e:
             # Silently fail if dashboard is not running
             pass
@@ -104,4 +102,5 @@ class DashboardClient:
             details['Detector'] = detector
         
         status = "Completed" if failed == 0 else "Completed with Errors"
-        self.send_update(status, 100, details)
\ No newline at end of file
+        self.send_update(status, 100, details)
+        self.close()
\ No newline at end of file
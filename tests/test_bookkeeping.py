@@ -0,0 +1,23 @@
+import urllib.parse
+
+import pytest
+
+requests = pytest.importorskip("requests")
+
+import bookkeeping
+
+
+def test_filter_params_encode_as_nested_bookkeeping_keys():
+    params = {**bookkeeping.BASE_PARAMS, "page[offset]": 0, "page[limit]": 600}
+    url = requests.Request("GET", bookkeeping.BK_URL, params=params).prepare().url
+
+    # same query the other bookkeeping scripts (get_paths, get_dates) send
+    expected = bookkeeping.BK_URL + "?" + urllib.parse.urlencode({
+        "filter[detectors][operator]": "and",
+        "filter[detectors][values]": "FT0",
+        "filter[runTypes][]": "5",
+        "filter[runQualities]": "good",
+        "page[offset]": 0,
+        "page[limit]": 600,
+    })
+    assert url == expected
@@ -0,0 +1,47 @@
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("psutil")
+pytest.importorskip("tqdm")
+pytest.importorskip("humanfriendly")
+
+import ctf_to_digits_converter as conv
+
+
+def test_already_done_yields_every_ctf_of_a_pending_run(tmp_path):
+    ctf_dir, out_dir = tmp_path / "ctf", tmp_path / "out"
+    ctf_dir.mkdir()
+    out_dir.mkdir()
+    names = ["o2_ctf_run00564587_0001.root", "o2_ctf_run00564587_0002.root"]
+    for name in names:
+        (ctf_dir / name).touch()
+
+    pending = sorted(p.name for p in conv.already_done(ctf_dir, out_dir))
+
+    assert pending == names
+
+
+def test_run_decoder_records_missing_workflow_instead_of_raising(tmp_path, monkeypatch):
+    monkeypatch.setenv("PATH", str(tmp_path))      # no o2 workflows anywhere
+
+    res = asyncio.run(conv.run_decoder(tmp_path / "o2_ctf_run00564587_0001.root",
+                                       tmp_path / "digits.root"))
+
+    assert res["rc"] == 127
+    assert "o2-ctf-reader-workflow" in res["stderr"]
+
+
+def test_legacy_json_ledger_is_migrated_once(tmp_path):
+    legacy = tmp_path / "digits_convert_ledger.json"
+    jsonl = tmp_path / "digits_convert_ledger.jsonl"
+    legacy.write_text(json.dumps([{"ctf": "a.root", "rc": 0}, {"ctf": "b.root", "rc": 1}], indent=2))
+    jsonl.write_bytes(b'{"ctf": "c.root", "rc": 0}')      # torn: no trailing newline
+
+    conv.migrate_legacy_ledger(legacy, jsonl)
+    conv.migrate_legacy_ledger(legacy, jsonl)
+
+    entries = [json.loads(l) for l in jsonl.read_text().splitlines()]
+    assert [e["ctf"] for e in entries] == ["c.root", "a.root", "b.root"]
+    assert not legacy.exists()
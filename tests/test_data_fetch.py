@@ -0,0 +1,72 @@
+import pytest
+
+pytest.importorskip("psutil")
+pytest.importorskip("rich")
+
+import data_fetch
+
+
+def test_integrity_verdicts_round_trip_through_the_ledger(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_fetch, "UPROOT_AVAILABLE", True)
+    ledger = tmp_path / data_fetch.INTEGRITY_LEDGER
+    digits = tmp_path / "run_564587_ft0digits.root"
+    digits.write_bytes(b"\0" * 2048)
+    key = data_fetch.integrity_key(digits, "FT0")
+
+    data_fetch.record_integrity(ledger, key, (True, "OK", {"size": 2048}))
+    data_fetch.record_integrity(ledger, key[:1] + ("x",) + key[2:], (False, "bad", {}))
+    with open(ledger, "a") as f:
+        f.write('[["torn"')
+
+    memo = data_fetch.read_integrity_ledger(ledger)
+    assert memo == {key: (True, "OK", {"size": 2048})}
+    assert data_fetch.check_file_integrity(digits, "FT0", memo[key]) == memo[key]
+
+
+def test_empty_listings_are_not_stored(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_fetch, "LISTING_CACHE", tmp_path)
+
+    data_fetch.store_listing("/alice/data/2024/LHC24a/564587", [])
+    data_fetch.store_listing("/alice/data/2024/LHC24a/564588", ["/alice/a.root"])
+
+    assert data_fetch.cached_listing("/alice/data/2024/LHC24a/564587") is None
+    assert data_fetch.cached_listing("/alice/data/2024/LHC24a/564588") == ["/alice/a.root"]
+
+
+def test_run_workflow_logs_missing_workflow_as_rc_127(tmp_path, monkeypatch):
+    monkeypatch.setenv("PATH", str(tmp_path))      # no o2 workflows anywhere
+    lst, log = tmp_path / "run_ctf_full.lst", tmp_path / "run.log"
+    lst.write_text("alien:///alice/a.root\n")
+
+    assert data_fetch.run_workflow("FT0", lst, tmp_path, log) == 127
+    assert "# exit code 127" in log.read_text()
+
+
+def _fake_alien_find(tmp_path, monkeypatch, script):
+    fake = tmp_path / "alien_find"
+    fake.write_text("#!/bin/sh\n" + script)
+    fake.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}:/usr/bin:/bin")
+
+
+def test_batched_find_gives_up_on_a_parent_full_of_other_runs(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_fetch, "BATCH_FIND_LINES_PER_RUN", 10)
+    period = "/alice/data/2024/LHC24a"
+    runs = [f"{period}/5645{i:02d}" for i in range(data_fetch.BATCH_FIND_MIN_RUNS)]
+    _fake_alien_find(tmp_path, monkeypatch,
+                     f'for i in $(seq 1 1000); do echo "{period}/999999/$i.root"; done\n')
+
+    assert data_fetch.collect_ctfs_batched(runs) is None
+    assert data_fetch.collect_ctfs_batched(runs[:1]) is None     # too few runs to batch
+
+
+def test_batched_find_splits_the_listing_per_run(tmp_path, monkeypatch):
+    period = "/alice/data/2024/LHC24a"
+    runs = [f"{period}/5645{i:02d}" for i in range(data_fetch.BATCH_FIND_MIN_RUNS)]
+    _fake_alien_find(tmp_path, monkeypatch,
+                     f'echo "{runs[0]}/raw/a.root"\necho "{period}/999999/b.root"\n')
+
+    found = data_fetch.collect_ctfs_batched(runs)
+
+    assert found[runs[0]] == [f"{runs[0]}/raw/a.root"]
+    assert not any(found[r] for r in runs[1:])